@@ -5,8 +5,8 @@
 실시간 스트리밍이 필요 없는 경우 사용합니다.
 """
 
-from datetime import datetime, timezone
 from typing import List, Optional
+import asyncio
 import uuid
 
 from fastapi import APIRouter, HTTPException
@@ -14,8 +14,10 @@ from pydantic import BaseModel, Field
 
 from ..config import get_settings
 from ..utils.logger import get_logger
-from ..rag import BedrockKnowledgeBase, create_knowledge_base_client
-from ..db import save_message, get_session_messages, get_session_history, delete_session, get_all_sessions
+from ..utils.timestamp import utc_now_iso
+from ..rag import get_kb_client, get_document_name
+from ..db import save_messages_bulk, get_session_messages, get_session_history, delete_session, get_all_sessions
+from .websocket import discard_session_state
 
 
 logger = get_logger(__name__)
@@ -80,22 +82,6 @@ class ErrorResponse(BaseModel):
     timestamp: str
 
 
-# Knowledge Base 클라이언트 (지연 초기화)
-_kb_client: Optional[BedrockKnowledgeBase] = None
-
-
-def get_kb_client() -> Optional[BedrockKnowledgeBase]:
-    """Knowledge Base 클라이언트를 반환합니다."""
-    global _kb_client
-    if _kb_client is None:
-        try:
-            _kb_client = create_knowledge_base_client()
-        except Exception as e:
-            logger.warning(f"Knowledge Base 초기화 실패: {e}")
-            _kb_client = None
-    return _kb_client
-
-
 @router.post(
     "/chat",
     response_model=ChatResponse,
@@ -119,18 +105,14 @@ async def chat(request: ChatRequest) -> ChatResponse:
     session_id = request.session_id or str(uuid.uuid4())
     user_message_id = str(uuid.uuid4())
     ai_message_id = str(uuid.uuid4())
-    timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    timestamp = utc_now_iso()
     
     # DB에서 대화 히스토리 가져오기
-    history = get_session_history(session_id)
-    
-    # 사용자 메시지 DB에 저장
-    save_message(
-        message_id=user_message_id,
-        session_id=session_id,
-        role="user",
-        content=request.message,
-        timestamp=timestamp
+    # 동기 SQLite 호출은 이벤트 루프를 막지 않도록 스레드에서 실행
+    history = await asyncio.to_thread(
+        get_session_history,
+        session_id,
+        limit=get_settings().max_history_messages,
     )
     
     logger.info(f"채팅 요청: session_id={session_id}, message={request.message[:50]}...")
@@ -140,15 +122,17 @@ async def chat(request: ChatRequest) -> ChatResponse:
         
         if kb_client:
             # Knowledge Base로 응답 생성
-            response = kb_client.retrieve_and_generate(
+            # 동기 boto3 호출은 이벤트 루프를 막지 않도록 스레드에서 실행
+            response = await asyncio.to_thread(
+                kb_client.retrieve_and_generate,
                 query=request.message,
-                conversation_history=history
+                conversation_history=history,
             )
             
             content = response.answer
             sources = [
                 Source(
-                    document=chunk.source_uri.split('/')[-1] if chunk.source_uri else 'unknown',
+                    document=get_document_name(chunk.source_uri),
                     source_uri=chunk.source_uri,
                     score=round(chunk.score, 3)
                 )
@@ -161,15 +145,24 @@ async def chat(request: ChatRequest) -> ChatResponse:
             sources = []
             sources_dict = []
         
-        # AI 응답 DB에 저장
-        save_message(
-            message_id=ai_message_id,
-            session_id=session_id,
-            role="assistant",
-            content=content,
-            sources=sources_dict if sources_dict else None,
-            timestamp=timestamp
-        )
+        # 사용자 메시지와 AI 응답을 한 번의 트랜잭션으로 저장
+        await asyncio.to_thread(save_messages_bulk, [
+            {
+                "message_id": user_message_id,
+                "session_id": session_id,
+                "role": "user",
+                "content": request.message,
+                "timestamp": timestamp,
+            },
+            {
+                "message_id": ai_message_id,
+                "session_id": session_id,
+                "role": "assistant",
+                "content": content,
+                "sources": sources_dict if sources_dict else None,
+                "timestamp": timestamp,
+            },
+        ])
         
         return ChatResponse(
             session_id=session_id,
@@ -186,7 +179,7 @@ async def chat(request: ChatRequest) -> ChatResponse:
             detail={
                 "code": "CHAT_ERROR",
                 "message": str(e),
-                "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+                "timestamp": utc_now_iso()
             }
         )
 
@@ -206,7 +199,9 @@ async def delete_chat_history(session_id: str) -> dict:
     Returns:
         dict: 삭제 결과
     """
-    deleted = delete_session(session_id)
+    # Socket.IO 연결이 캐시한 히스토리와 저장 대기 중인 턴을 먼저 정리
+    await discard_session_state(session_id)
+    deleted = await asyncio.to_thread(delete_session, session_id)
     
     if deleted:
         return {"message": "대화 히스토리가 삭제되었습니다.", "session_id": session_id}
@@ -229,7 +224,7 @@ async def get_chat_history_endpoint(session_id: str) -> dict:
     Returns:
         dict: 대화 히스토리
     """
-    messages = get_session_messages(session_id)
+    messages = await asyncio.to_thread(get_session_messages, session_id)
     # Frontend 형식에 맞게 변환
     formatted_messages = []
     for m in messages:
@@ -263,7 +258,7 @@ async def list_sessions() -> dict:
     Returns:
         dict: 세션 목록
     """
-    sessions = get_all_sessions()
+    sessions = await asyncio.to_thread(get_all_sessions)
     return {
         "sessions": sessions,
         "count": len(sessions)
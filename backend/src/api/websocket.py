@@ -3,25 +3,57 @@ Socket.IO 이벤트 핸들러 모듈
 
 이 모듈은 Socket.IO 서버 설정 및 실시간 통신 이벤트를 처리합니다.
 채팅 메시지 송수신, 스트리밍 응답 등을 담당합니다.
+
+PERF: 이 모듈의 핫패스는 I/O 바운드입니다 (CPU 최적화보다 동시성과 배칭이 중요).
+    - chat_message: Knowledge Base/Bedrock 호출 대기, SQLite 조회/저장
+    - _send_bedrock_response: Bedrock 스트리밍 응답 대기
+    - StreamChunkBuffer: Socket.IO emit (토큰 단위가 아닌 주기 단위로 배칭)
+    async 함수 안에서 time.sleep, 동기 HTTP 호출, 동기 DB 호출을 직접 실행하지 말고
+    asyncio.to_thread 또는 백그라운드 작업(_background_tasks)을 사용하세요.
 """
 
-from datetime import datetime, timezone
-from typing import Optional
-import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, List, Optional
 import asyncio
+import re
+import time
+import uuid
 
+import orjson
 import socketio
 from pydantic import BaseModel, Field
 
 from ..config import get_settings
+from ..utils.exceptions import ValidationError
 from ..utils.logger import get_logger
-from ..rag import BedrockKnowledgeBase, create_knowledge_base_client
-from ..db import save_message, get_session_history
+from ..utils.timestamp import utc_now_iso
+from ..rag import get_kb_client, get_document_name, iter_words
+from ..bedrock_client import get_bedrock_client, BedrockError
+from ..db import save_messages_bulk, get_session_history
 
 
 logger = get_logger(__name__)
 
 
+class _OrjsonAdapter:
+    """
+    Socket.IO/Engine.IO 패킷 직렬화용 orjson 어댑터
+    
+    python-socketio는 `json` 모듈과 같은 인터페이스(dumps는 str 반환)를 기대하므로
+    orjson의 bytes 결과를 str로 변환합니다. separators 등 stdlib 전용 인자는
+    orjson 출력이 이미 공백 없는 형태이므로 무시합니다.
+    """
+    
+    @staticmethod
+    def dumps(obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+    
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
 # Socket.IO 서버 인스턴스 생성
 # async_mode='asgi'로 FastAPI와 통합
 sio = socketio.AsyncServer(
@@ -29,29 +61,75 @@ sio = socketio.AsyncServer(
     cors_allowed_origins=[],  # CORS는 FastAPI에서 처리
     logger=False,
     engineio_logger=False,
+    json=_OrjsonAdapter,
 )
 
 
-class ChatMessageRequest(BaseModel):
+# 채팅 메시지 최대 길이 (REST API의 ChatRequest와 동일)
+MAX_MESSAGE_LENGTH = 10000
+
+
+@dataclass
+class ChatMessageRequest:
     """
     채팅 메시지 요청 모델
     
+    소켓 메시지마다 생성되므로 Pydantic 모델 대신 dataclass와 직접 작성한
+    검증(from_payload)을 사용합니다.
+    
     Attributes:
         session_id: 세션 식별자
         message: 사용자 메시지 내용
         timestamp: 메시지 전송 시간 (선택)
     """
-    session_id: str = Field(..., alias="sessionId", description="세션 식별자")
-    message: str = Field(..., min_length=1, max_length=10000, description="메시지 내용")
-    timestamp: Optional[str] = Field(default=None, description="메시지 전송 시간")
+    session_id: str
+    message: str
+    timestamp: Optional[str] = None
     
-    model_config = {"populate_by_name": True}
+    @classmethod
+    def from_payload(cls, data: dict) -> "ChatMessageRequest":
+        """
+        chat_message 이벤트 페이로드를 검증하여 요청 객체를 생성합니다.
+        
+        세션 ID는 `sessionId`와 `session_id` 키를 모두 허용합니다.
+        
+        Args:
+            data: 메시지 데이터 (sessionId, message, timestamp)
+        
+        Returns:
+            ChatMessageRequest: 검증된 요청
+        
+        Raises:
+            ValidationError: 필수 필드가 없거나 형식이 올바르지 않을 때
+        """
+        if not isinstance(data, dict):
+            raise ValidationError("메시지 데이터 형식이 올바르지 않습니다.")
+        
+        session_id = data.get("sessionId", data.get("session_id"))
+        if not isinstance(session_id, str):
+            raise ValidationError("세션 ID가 필요합니다.", field="sessionId")
+        
+        message = data.get("message")
+        if not isinstance(message, str) or not 1 <= len(message) <= MAX_MESSAGE_LENGTH:
+            raise ValidationError(
+                f"메시지는 1자 이상 {MAX_MESSAGE_LENGTH}자 이하여야 합니다.",
+                field="message",
+            )
+        
+        timestamp = data.get("timestamp")
+        if timestamp is not None and not isinstance(timestamp, str):
+            raise ValidationError("메시지 전송 시간 형식이 올바르지 않습니다.", field="timestamp")
+        
+        return cls(session_id=session_id, message=message, timestamp=timestamp)
 
 
 class ChatResponseChunk(BaseModel):
     """
     스트리밍 응답 청크 모델
     
+    chat_response_chunk 페이로드 스키마입니다. 전송 시에는 검증 비용을 피하기 위해
+    같은 키를 가진 dict를 사용합니다 (StreamChunkBuffer 참고).
+    
     Attributes:
         session_id: 세션 식별자
         content: 응답 내용 (토큰)
@@ -80,6 +158,8 @@ class ChatError(BaseModel):
     """
     에러 응답 모델
     
+    chat_error 페이로드 스키마입니다. 전송 시에는 같은 키를 가진 dict를 사용합니다.
+    
     Attributes:
         session_id: 세션 식별자
         code: 에러 코드
@@ -90,23 +170,340 @@ class ChatError(BaseModel):
     message: str
 
 
+@dataclass
+class ConnectionState:
+    """
+    연결별 세션 상태
+    
+    Socket.IO 연결은 한 프로세스에 고정되므로 최근 대화 히스토리를 메모리에
+    유지하여 메시지마다 DB를 조회하지 않습니다. DB 저장은 백그라운드 작업으로
+    진행되고 메모리 히스토리는 즉시 갱신됩니다.
+    
+    Attributes:
+        session_id: 세션 식별자
+        history: 최근 대화 히스토리 (role, content)
+        last_active: 마지막 활동 시각 (time.monotonic 기준)
+    """
+    session_id: str
+    history: Deque[dict]
+    last_active: float = field(default_factory=time.monotonic)
+
+
 # 연결된 클라이언트 세션 관리
-connected_sessions: dict[str, str] = {}  # sid -> session_id
+connected_sessions: dict[str, ConnectionState] = {}  # sid -> ConnectionState
+
+# 응답 전송 후 백그라운드로 실행되는 DB 저장 작업 (GC 방지용 강한 참조)
+_background_tasks: set[asyncio.Task] = set()
+
+# 세션별 마지막 DB 저장 작업 (연결 상태가 교체되거나 정리되어도 유지)
+_pending_writes: dict[str, asyncio.Task] = {}
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    """백그라운드 작업 완료 콜백. 실패한 작업의 예외를 로깅합니다."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"백그라운드 DB 저장 실패: {task.exception()}")
+
 
-# Knowledge Base 클라이언트 (지연 초기화)
-_kb_client: Optional[BedrockKnowledgeBase] = None
+async def _persist_turn(rows: List[dict], previous: Optional[asyncio.Task]) -> None:
+    """
+    대화 턴을 DB에 저장합니다.
+    
+    같은 연결의 이전 저장 작업이 끝난 뒤 실행하여 메시지 순서를 유지합니다.
+    
+    Args:
+        rows: 저장할 메시지 목록
+        previous: 같은 연결의 이전 저장 작업 (선택)
+    """
+    if previous is not None and not previous.done():
+        await asyncio.wait([previous])
+    # 동기 SQLite 호출은 이벤트 루프를 막지 않도록 스레드에서 실행
+    await asyncio.to_thread(save_messages_bulk, rows)
 
 
-def get_kb_client() -> Optional[BedrockKnowledgeBase]:
-    """Knowledge Base 클라이언트를 반환합니다."""
-    global _kb_client
-    if _kb_client is None:
+def _schedule_turn_write(session_id: str, rows: List[dict]) -> None:
+    """
+    대화 턴 저장 작업을 백그라운드로 예약합니다.
+    
+    같은 세션의 이전 저장 작업 뒤에 실행되도록 연결하고, 세션의 마지막 저장
+    작업으로 기록합니다.
+    
+    Args:
+        session_id: 세션 식별자
+        rows: 저장할 메시지 목록
+    """
+    task = asyncio.create_task(_persist_turn(rows, _pending_writes.get(session_id)))
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+    _pending_writes[session_id] = task
+    
+    def _forget(done: asyncio.Task) -> None:
+        if _pending_writes.get(session_id) is done:
+            del _pending_writes[session_id]
+    
+    task.add_done_callback(_forget)
+
+
+async def _wait_for_pending_write(session_id: str) -> None:
+    """세션의 진행 중인 DB 저장 작업이 끝날 때까지 기다립니다 (실패해도 예외를 전달하지 않음)."""
+    task = _pending_writes.get(session_id)
+    if task is not None and not task.done():
+        await asyncio.wait([task])
+
+
+async def discard_session_state(session_id: str) -> None:
+    """
+    세션의 메모리 상태를 폐기합니다.
+    
+    세션 삭제 전에 호출하여, 진행 중인 저장 작업이 삭제 후 세션을 다시 만들거나
+    연결된 소켓이 삭제된 히스토리를 계속 사용하지 않도록 합니다.
+    
+    Args:
+        session_id: 세션 식별자
+    """
+    await _wait_for_pending_write(session_id)
+    for sid in [sid for sid, state in connected_sessions.items() if state.session_id == session_id]:
+        del connected_sessions[sid]
+
+
+# 유휴 세션 정리 작업
+_reaper_task: Optional[asyncio.Task] = None
+
+# 유휴 세션 정리 주기 (초)
+_REAPER_INTERVAL_SECONDS = 60
+
+
+async def _reap_idle_sessions() -> None:
+    """
+    일정 시간 이상 활동이 없는 연결 상태를 주기적으로 정리합니다.
+    
+    클라이언트가 비정상 종료되어 disconnect 이벤트가 오지 않은 경우에도
+    connected_sessions가 무한히 커지지 않도록 합니다. 정리된 연결이 다시
+    메시지를 보내면 DB에서 히스토리를 다시 로드합니다.
+    """
+    ttl = get_settings().session_idle_ttl_seconds
+    while True:
+        await asyncio.sleep(_REAPER_INTERVAL_SECONDS)
+        now = time.monotonic()
+        expired = [
+            sid for sid, state in connected_sessions.items()
+            if now - state.last_active > ttl
+        ]
+        for sid in expired:
+            connected_sessions.pop(sid, None)
+        if expired:
+            logger.info(f"유휴 세션 정리: {len(expired)}개")
+
+
+def start_session_reaper() -> None:
+    """유휴 세션 정리 작업을 시작합니다 (앱 시작 시 사용)."""
+    global _reaper_task
+    if _reaper_task is None or _reaper_task.done():
+        _reaper_task = asyncio.create_task(_reap_idle_sessions())
+
+
+async def stop_session_reaper() -> None:
+    """유휴 세션 정리 작업을 중지합니다 (앱 종료 시 사용)."""
+    global _reaper_task
+    if _reaper_task is not None:
+        _reaper_task.cancel()
         try:
-            _kb_client = create_knowledge_base_client()
-        except Exception as e:
-            logger.warning(f"Knowledge Base 초기화 실패 (에코 모드로 동작): {e}")
-            _kb_client = None
-    return _kb_client
+            await _reaper_task
+        except asyncio.CancelledError:
+            pass
+        _reaper_task = None
+
+
+async def drain_background_tasks() -> None:
+    """진행 중인 백그라운드 DB 저장 작업이 모두 끝날 때까지 기다립니다 (종료 시 사용)."""
+    if _background_tasks:
+        await asyncio.wait(list(_background_tasks))
+
+
+async def _load_connection_state(session_id: str, prefetch: bool = True) -> ConnectionState:
+    """
+    세션 상태를 생성하고 DB에서 최근 대화 히스토리를 미리 로드합니다.
+    
+    Args:
+        session_id: 세션 식별자
+        prefetch: DB에서 히스토리를 로드할지 여부 (새 세션이면 False)
+    
+    Returns:
+        ConnectionState: 세션 상태
+    """
+    limit = get_settings().max_history_messages
+    history: List[dict] = []
+    if prefetch:
+        # 이전 연결 상태에서 예약된 저장이 끝나야 마지막 턴까지 읽을 수 있음
+        await _wait_for_pending_write(session_id)
+        # 동기 SQLite 호출은 이벤트 루프를 막지 않도록 스레드에서 실행
+        history = await asyncio.to_thread(get_session_history, session_id, limit=limit)
+    return ConnectionState(
+        session_id=session_id,
+        history=deque(history, maxlen=limit or None),
+    )
+
+
+# Knowledge Base가 관련 문서를 찾지 못했을 때 반환하는 답변의 접두사
+_KB_REFUSAL_PREFIX = "sorry, i am unable"
+
+
+def _is_kb_refusal(answer: str) -> bool:
+    """
+    Knowledge Base 답변이 답변 거부 메시지인지 확인합니다.
+    
+    답변 전체를 복사하지 않도록 앞부분만 잘라서 비교합니다.
+    
+    Args:
+        answer: Knowledge Base 답변
+    
+    Returns:
+        bool: 답변 거부 여부
+    """
+    head = answer[:64].lstrip()
+    return head[:len(_KB_REFUSAL_PREFIX)].lower() == _KB_REFUSAL_PREFIX
+
+
+# 문서 검색이 필요 없는 인사/감사 메시지 패턴
+# ("네", "yes" 같은 짧은 대답은 이전 답변의 후속 질문에 대한 응답일 수 있으므로 제외)
+_SMALL_TALK_PATTERN = re.compile(
+    r"(안녕(하세요)?|고마워(요)?|감사(합니다|해요)?|"
+    r"hi|hello|hey|thanks?|thank you)[\s\W]*",
+    re.IGNORECASE,
+)
+
+
+def _needs_retrieval(query: str) -> bool:
+    """
+    질문에 Knowledge Base 검색이 필요한지 확인합니다.
+    
+    인사나 감사 인사처럼 문서 맥락이 도움이 되지 않는 메시지는
+    RetrieveAndGenerate 호출 없이 Bedrock으로 바로 응답하도록 합니다.
+    
+    Args:
+        query: 사용자 질문
+    
+    Returns:
+        bool: 검색 필요 여부
+    """
+    return _SMALL_TALK_PATTERN.fullmatch(query.strip()) is None
+
+
+# 전송 주기 만료로 예약된 청크 전송 작업 (GC 방지용 강한 참조)
+_flush_tasks: set[asyncio.Task] = set()
+
+
+def _on_flush_task_done(task: asyncio.Task) -> None:
+    """예약된 청크 전송 완료 콜백. 실패한 전송의 예외를 로깅합니다."""
+    _flush_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"스트리밍 청크 전송 실패: {task.exception()}")
+
+
+class StreamChunkBuffer:
+    """
+    스트리밍 청크 마이크로 배칭 버퍼
+    
+    토큰마다 chat_response_chunk를 emit하지 않고, 일정 시간 또는 일정 크기만큼
+    모아서 하나의 이벤트로 전송합니다. Socket.IO 패킷 인코딩과 TCP 세그먼트
+    수가 토큰 수가 아닌 전송 주기에 비례하게 됩니다.
+    다음 토큰이 늦게 오더라도 버퍼에 쌓인 텍스트는 전송 주기 안에 전송되며,
+    close()는 버퍼가 비어 있어도 is_final=True 청크를 전송합니다.
+    
+    Attributes:
+        sid: Socket.IO 세션 ID
+        session_id: 세션 식별자
+    """
+    
+    def __init__(
+        self,
+        sid: str,
+        session_id: str,
+        flush_interval: Optional[float] = None,
+        flush_chars: Optional[int] = None,
+    ):
+        """
+        StreamChunkBuffer 초기화
+        
+        Args:
+            sid: Socket.IO 세션 ID
+            session_id: 세션 식별자
+            flush_interval: 전송 주기 (초, 기본값: 설정에서 로드)
+            flush_chars: 즉시 전송 기준 크기 (문자 수, 기본값: 설정에서 로드)
+        """
+        settings = get_settings()
+        self.sid = sid
+        self.session_id = session_id
+        self._flush_interval = (
+            flush_interval if flush_interval is not None
+            else settings.stream_flush_interval_ms / 1000
+        )
+        self._flush_chars = flush_chars or settings.stream_flush_chars
+        self._parts: List[str] = []
+        self._size = 0
+        self._deadline: Optional[asyncio.TimerHandle] = None
+    
+    async def add(self, text: str) -> None:
+        """
+        텍스트를 버퍼에 추가하고, 전송 조건을 만족하면 flush합니다.
+        
+        Args:
+            text: 스트리밍 텍스트 조각
+        """
+        if not text:
+            return
+        
+        self._parts.append(text)
+        self._size += len(text)
+        
+        if self._size >= self._flush_chars:
+            await self._flush(is_final=False)
+        elif self._deadline is None:
+            # 첫 텍스트가 쌓인 시점부터 전송 주기가 지나면 다음 토큰을 기다리지 않고 전송
+            self._deadline = asyncio.get_running_loop().call_later(
+                self._flush_interval, self._on_deadline
+            )
+    
+    async def close(self) -> None:
+        """남은 텍스트를 마지막 청크로 전송합니다 (비어 있어도 종료 표시는 전송)."""
+        await self._flush(is_final=True)
+    
+    def discard(self) -> None:
+        """전송하지 않은 텍스트를 버리고 예약된 flush를 취소합니다."""
+        self._cancel_deadline()
+        self._parts.clear()
+        self._size = 0
+    
+    def _cancel_deadline(self) -> None:
+        """예약된 flush가 있으면 취소합니다."""
+        if self._deadline is not None:
+            self._deadline.cancel()
+            self._deadline = None
+    
+    def _on_deadline(self) -> None:
+        """전송 주기가 지나면 버퍼 내용을 백그라운드로 전송합니다."""
+        self._deadline = None
+        task = asyncio.create_task(self._flush(is_final=False))
+        _flush_tasks.add(task)
+        task.add_done_callback(_on_flush_task_done)
+    
+    async def _flush(self, is_final: bool) -> None:
+        """버퍼 내용을 하나의 chat_response_chunk 이벤트로 전송합니다."""
+        self._cancel_deadline()
+        if not self._parts and not is_final:
+            return
+        
+        content = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        
+        # 핫패스이므로 ChatResponseChunk 모델 대신 동일한 형태의 dict를 직접 전송
+        await sio.emit('chat_response_chunk', {
+            'session_id': self.session_id,
+            'content': content,
+            'is_final': is_final,
+        }, to=self.sid)
 
 
 @sio.event
@@ -125,10 +522,13 @@ async def connect(sid: str, environ: dict, auth: Optional[dict] = None):
     
     # 세션 ID 생성 또는 auth에서 가져오기
     session_id = auth.get("session_id") if auth else None
-    if not session_id:
+    is_new_session = not session_id
+    if is_new_session:
         session_id = str(uuid.uuid4())
     
-    connected_sessions[sid] = session_id
+    connected_sessions[sid] = await _load_connection_state(
+        session_id, prefetch=not is_new_session
+    )
     
     # 연결 확인 메시지 전송
     await sio.emit('connection_established', {
@@ -149,7 +549,8 @@ async def disconnect(sid: str):
     Args:
         sid: Socket.IO 세션 ID
     """
-    session_id = connected_sessions.pop(sid, None)
+    state = connected_sessions.pop(sid, None)
+    session_id = state.session_id if state else None
     logger.info(f"클라이언트 연결 해제: sid={sid}, session_id={session_id}")
 
 
@@ -167,90 +568,94 @@ async def chat_message(sid: str, data: dict):
     """
     try:
         # 요청 데이터 검증
-        request = ChatMessageRequest(**data)
+        request = ChatMessageRequest.from_payload(data)
         logger.info(f"메시지 수신: sid={sid}, session_id={request.session_id}")
         
-        # 세션 ID 업데이트
-        connected_sessions[sid] = request.session_id
+        # 세션 상태 조회 (세션이 바뀌었으면 DB에서 히스토리를 다시 로드)
+        state = connected_sessions.get(sid)
+        if state is None or state.session_id != request.session_id:
+            state = await _load_connection_state(request.session_id)
+            connected_sessions[sid] = state
+        state.last_active = time.monotonic()
         
-        timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        timestamp = utc_now_iso()
         user_message_id = str(uuid.uuid4())
         ai_message_id = str(uuid.uuid4())
         
-        # DB에서 대화 히스토리 가져오기
-        history = get_session_history(request.session_id)
-        
-        # 사용자 메시지 DB에 저장
-        save_message(
-            message_id=user_message_id,
-            session_id=request.session_id,
-            role="user",
-            content=request.message,
-            timestamp=timestamp
-        )
+        # 메모리에 유지 중인 대화 히스토리 사용
+        history = list(state.history)
         
         sources = []
+        full_response: Optional[str] = None
         
         # Knowledge Base 클라이언트 사용 시도
         kb_client = get_kb_client()
         
-        if kb_client:
+        if kb_client and _needs_retrieval(request.message):
             try:
                 # Knowledge Base 응답 생성 (먼저 전체 응답 확인)
-                kb_response = kb_client.retrieve_and_generate(
+                # 동기 boto3 호출은 이벤트 루프를 막지 않도록 스레드에서 실행
+                kb_response = await asyncio.to_thread(
+                    kb_client.retrieve_and_generate,
                     query=request.message,
-                    conversation_history=history
+                    conversation_history=history,
                 )
                 
-                full_response = kb_response.answer
+                answer = kb_response.answer
                 
                 # Knowledge Base가 답변을 거부한 경우 일반 Bedrock으로 fallback
-                if full_response.strip().lower().startswith("sorry, i am unable"):
+                if _is_kb_refusal(answer):
                     logger.info("Knowledge Base 답변 거부, Bedrock 직접 호출로 fallback")
-                    await _send_bedrock_response(sid, request, ai_message_id, timestamp, history)
-                    return
-                
-                # 정상 응답이면 스트리밍으로 전송
-                words = full_response.split()
-                for i, word in enumerate(words):
-                    is_last = (i == len(words) - 1)
-                    chunk = ChatResponseChunk(
-                        session_id=request.session_id,
-                        content=word + (" " if not is_last else ""),
-                        is_final=is_last
-                    )
-                    await sio.emit('chat_response_chunk', chunk.model_dump(), to=sid)
-                    await asyncio.sleep(0.02)  # 자연스러운 타이핑 효과
-                
-                # 출처 정보 추출
-                for chunk_info in kb_response.retrieved_chunks:
-                    uri = chunk_info.source_uri
-                    filename = uri.split('/')[-1] if uri else 'unknown'
+                else:
+                    # 정상 응답이면 스트리밍으로 전송
+                    # 단어 목록을 미리 만들지 않고 원본 공백/줄바꿈을 유지하며 전송
+                    buffer = StreamChunkBuffer(sid, request.session_id)
+                    for word in iter_words(answer):
+                        await buffer.add(word)
+                    await buffer.close()
                     
-                    sources.append({
-                        'document': filename,
-                        'source_uri': uri,
-                        'score': round(chunk_info.score, 3)
-                    })
-                
-                # AI 응답 DB에 저장
-                save_message(
-                    message_id=ai_message_id,
-                    session_id=request.session_id,
-                    role="assistant",
-                    content=full_response,
-                    sources=sources if sources else None,
-                    timestamp=timestamp
-                )
+                    # 출처 정보 추출
+                    for chunk_info in kb_response.retrieved_chunks:
+                        sources.append({
+                            'document': get_document_name(chunk_info.source_uri),
+                            'source_uri': chunk_info.source_uri,
+                            'score': round(chunk_info.score, 3)
+                        })
+                    
+                    full_response = answer
                 
             except Exception as e:
                 logger.error(f"Knowledge Base 처리 오류, Bedrock 직접 호출로 폴백: {e}")
-                await _send_bedrock_response(sid, request, ai_message_id, timestamp, history)
-                return
-        else:
-            # Knowledge Base가 없으면 Bedrock 직접 호출
-            await _send_bedrock_response(sid, request, ai_message_id, timestamp, history)
-            return
+                sources = []
+        
+        if full_response is None:
+            # Knowledge Base가 없거나 답변하지 못하면 Bedrock 직접 호출
+            full_response = await _send_bedrock_response(sid, request, history)
+        
+        # 사용자 메시지와 AI 응답을 한 번의 트랜잭션으로 저장
+        # 응답 완료를 DB 쓰기에 묶지 않도록 백그라운드로 실행
+        rows = [
+            {
+                "message_id": user_message_id,
+                "session_id": request.session_id,
+                "role": "user",
+                "content": request.message,
+                "timestamp": timestamp,
+            },
+            {
+                "message_id": ai_message_id,
+                "session_id": request.session_id,
+                "role": "assistant",
+                "content": full_response,
+                "sources": sources if sources else None,
+                "timestamp": timestamp,
+            },
+        ]
+        _schedule_turn_write(request.session_id, rows)
+        
+        # 메모리 히스토리 갱신 (write-behind)
+        state.history.append({"role": "user", "content": request.message})
+        state.history.append({"role": "assistant", "content": full_response})
         
         # 응답 완료 이벤트
         complete = ChatResponseComplete(
@@ -265,106 +670,77 @@ async def chat_message(sid: str, data: dict):
     except Exception as e:
         logger.error(f"메시지 처리 오류: sid={sid}, error={str(e)}")
         
-        session_id = connected_sessions.get(sid, data.get('session_id', 'unknown'))
-        error = ChatError(
-            session_id=session_id,
-            code="MESSAGE_PROCESSING_ERROR",
-            message=str(e)
-        )
-        await sio.emit('chat_error', error.model_dump(), to=sid)
+        state = connected_sessions.get(sid)
+        session_id = state.session_id if state else data.get('session_id', 'unknown')
+        # 과부하 시 에러 경로 비용을 줄이기 위해 ChatError 모델 대신 dict를 직접 전송
+        await sio.emit('chat_error', {
+            'session_id': session_id,
+            'code': "MESSAGE_PROCESSING_ERROR",
+            'message': str(e),
+        }, to=sid)
+
+
+# Bedrock 직접 호출 시 사용하는 시스템 프롬프트 (요청마다 새로 만들지 않도록 모듈 상수로 유지)
+_BEDROCK_SYSTEM_PROMPT = """당신은 친절하고 도움이 되는 AI 어시스턴트입니다. 
+사용자의 질문에 정확하고 유용한 답변을 제공해주세요.
+한국어로 질문하면 한국어로 답변하고, 영어로 질문하면 영어로 답변해주세요."""
 
 
 async def _send_bedrock_response(
     sid: str, 
     request: ChatMessageRequest, 
-    message_id: str, 
-    timestamp: str,
     history: list
-):
-    """Bedrock 모델을 직접 호출하여 응답을 전송합니다."""
-    from ..bedrock_client import get_bedrock_client, BedrockError
+) -> str:
+    """
+    Bedrock 모델을 직접 호출하여 응답을 스트리밍합니다.
     
+    Returns:
+        str: 전송한 전체 응답 내용
+    """
+    buffer = StreamChunkBuffer(sid, request.session_id)
     try:
         bedrock_client = get_bedrock_client()
-        full_response = ""
-        
-        # 시스템 프롬프트
-        system_prompt = """당신은 친절하고 도움이 되는 AI 어시스턴트입니다. 
-사용자의 질문에 정확하고 유용한 답변을 제공해주세요.
-한국어로 질문하면 한국어로 답변하고, 영어로 질문하면 영어로 답변해주세요."""
+        # 토큰은 리스트에 모았다가 마지막에 한 번만 합칩니다 (반복 문자열 연결 방지)
+        parts: List[str] = []
         
         # 스트리밍 응답 생성
         async for token in bedrock_client.invoke_stream(
             prompt=request.message,
-            system_prompt=system_prompt,
+            system_prompt=_BEDROCK_SYSTEM_PROMPT,
             conversation_history=history
         ):
             if token:
-                full_response += token
-                chunk = ChatResponseChunk(
-                    session_id=request.session_id,
-                    content=token,
-                    is_final=False
-                )
-                await sio.emit('chat_response_chunk', chunk.model_dump(), to=sid)
+                parts.append(token)
+                await buffer.add(token)
+        await buffer.close()
         
-        # DB에 저장
-        save_message(
-            message_id=message_id,
-            session_id=request.session_id,
-            role="assistant",
-            content=full_response,
-            timestamp=timestamp
-        )
-        
-        # 응답 완료
-        complete = ChatResponseComplete(
-            session_id=request.session_id,
-            message_id=message_id,
-            sources=[]
-        )
-        await sio.emit('chat_response_complete', complete.model_dump(), to=sid)
-        
-        logger.info(f"Bedrock 직접 응답 완료: sid={sid}, message_id={message_id}")
+        logger.info(f"Bedrock 직접 응답 완료: sid={sid}")
+        return "".join(parts)
         
     except BedrockError as e:
         logger.error(f"Bedrock 호출 실패: {e}")
+        # 전송하지 못한 토큰이 fallback 응답 뒤에 전송되지 않도록 버퍼를 비움
+        buffer.discard()
         # Bedrock도 실패하면 에코 모드로 fallback
-        await _send_echo_response(sid, request, message_id, timestamp)
+        return await _send_echo_response(sid, request)
 
 
-async def _send_echo_response(sid: str, request: ChatMessageRequest, message_id: str, timestamp: str):
-    """에코 응답을 전송합니다 (Bedrock 연결 불가 시)."""
+async def _send_echo_response(sid: str, request: ChatMessageRequest) -> str:
+    """
+    에코 응답을 스트리밍합니다 (Bedrock 연결 불가 시).
+    
+    Returns:
+        str: 전송한 전체 응답 내용
+    """
     response_content = f"현재 AI 서비스에 연결할 수 없습니다. 잠시 후 다시 시도해주세요."
     
     # 스트리밍 시뮬레이션
-    tokens = response_content.split()
-    for i, token in enumerate(tokens):
-        is_final = (i == len(tokens) - 1)
-        chunk = ChatResponseChunk(
-            session_id=request.session_id,
-            content=token + (" " if not is_final else ""),
-            is_final=is_final
-        )
-        await sio.emit('chat_response_chunk', chunk.model_dump(), to=sid)
-        await asyncio.sleep(0.05)  # 타이핑 효과
-    
-    # 에코 응답도 DB에 저장
-    save_message(
-        message_id=message_id,
-        session_id=request.session_id,
-        role="assistant",
-        content=response_content,
-        timestamp=timestamp
-    )
+    buffer = StreamChunkBuffer(sid, request.session_id)
+    for word in iter_words(response_content):
+        await buffer.add(word)
+    await buffer.close()
     
-    # 응답 완료
-    complete = ChatResponseComplete(
-        session_id=request.session_id,
-        message_id=message_id,
-        sources=[]
-    )
-    await sio.emit('chat_response_complete', complete.model_dump(), to=sid)
+    return response_content
 
 
 @sio.event
@@ -379,7 +755,7 @@ async def ping(sid: str, data: dict = None):
         data: 추가 데이터 (선택)
     """
     await sio.emit('pong', {
-        'timestamp': datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        'timestamp': utc_now_iso()
     }, to=sid)
 
 
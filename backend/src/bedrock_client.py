@@ -5,14 +5,22 @@ AWS Bedrock 클라이언트 모듈
 Claude Sonnet 4.5 모델 호출 및 스트리밍 응답을 지원합니다.
 """
 
-import json
+import asyncio
 import logging
-from typing import AsyncGenerator, Optional, Dict, Any, List
+import random
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache
+from typing import AsyncGenerator, Optional, Dict, Any, List, Union
 from dataclasses import dataclass
 
-import boto3
-from botocore.config import Config as BotoConfig
-from botocore.exceptions import ClientError, BotoCoreError
+import orjson
+# except 절에서 쓰는 예외만 모듈 수준에서 import (aiobotocore는 __init__에서 import)
+from botocore.exceptions import (
+    BotoCoreError,
+    ClientError,
+    ConnectionError as BotoConnectionError,
+    HTTPClientError,
+)
 
 from .config import get_settings, get_aws_config, get_bedrock_config
 
@@ -21,13 +29,15 @@ from .config import get_settings, get_aws_config, get_bedrock_config
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BedrockResponse:
     """Bedrock 응답 데이터 클래스"""
     content: str
     stop_reason: Optional[str] = None
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
     model_id: str = ""
 
 
@@ -51,12 +61,78 @@ class BedrockRateLimitError(BedrockError):
     pass
 
 
+# 스트리밍 이벤트 타입과 기본값 (토큰마다 새 객체를 만들지 않도록 모듈 상수로 유지)
+_TYPE_DELTA = "content_block_delta"
+_TYPE_STOP = "message_stop"
+
+# 프롬프트 캐싱 사용 시 캐시 지점에 붙이는 마커
+_CACHE_CONTROL: Dict[str, str] = {"type": "ephemeral"}
+_EMPTY: Dict[str, Any] = {}
+
+# 잠시 후 다시 시도하면 성공할 수 있는 Bedrock 오류 코드
+# (ValidationException 등 나머지 오류는 재시도 없이 즉시 실패)
+_RETRYABLE_ERROR_CODES = frozenset((
+    "ThrottlingException",
+    "ServiceUnavailableException",
+    "ModelTimeoutException",
+    "InternalServerException",
+))
+
+
+# 풀의 유휴 커넥션 유지 시간 (초). AWS 엔드포인트의 유휴 종료(약 20초)보다 짧게 유지하여
+# 서버가 이미 닫은 커넥션을 재사용하지 않도록 함
+_KEEPALIVE_TIMEOUT_SECONDS = 15
+
+
+# 커넥션 풀이 오염되었음을 나타내는 예외 (ConnectionClosedError, ReadTimeoutError 등 포함)
+@lru_cache(maxsize=1)
+def _stale_connection_errors() -> tuple:
+    """끊어진 커넥션을 나타내는 예외 타입들 (aiohttp는 첫 사용 시 import)"""
+    import aiohttp
+    
+    return (HTTPClientError, aiohttp.ClientConnectionError)
+
+
+# 이 모듈들 내부에서 발생한 AssertionError는 끊어진 커넥션 재사용으로 간주
+_STALE_CONNECTION_MODULES = ("aiohttp.", "aiobotocore.", "botocore.", "urllib3.")
+
+
+def is_stale_connection_error(exc: BaseException) -> bool:
+    """
+    예외가 오래되거나 끊어진 커넥션 때문에 발생했는지 확인합니다.
+    
+    NAT 유휴 타임아웃이나 TCP RST로 풀의 커넥션이 끊어지면 이후 요청이 계속
+    실패하므로, 이 경우 클라이언트를 다시 생성해야 합니다.
+    
+    Args:
+        exc: 확인할 예외
+    
+    Returns:
+        bool: 커넥션 문제로 인한 예외 여부
+    """
+    if isinstance(exc, _stale_connection_errors()):
+        return True
+    
+    if isinstance(exc, AssertionError) and exc.__traceback__ is not None:
+        # 예외가 발생한 가장 안쪽 프레임의 모듈 확인
+        tb = exc.__traceback__
+        while tb.tb_next is not None:
+            tb = tb.tb_next
+        module = tb.tb_frame.f_globals.get("__name__", "")
+        return module.startswith(_STALE_CONNECTION_MODULES)
+    
+    return False
+
+
 class BedrockClient:
     """
     AWS Bedrock 클라이언트 클래스
     
     Claude Sonnet 4.5 모델을 사용하여 텍스트 생성을 수행합니다.
     스트리밍 및 비스트리밍 응답을 모두 지원합니다.
+    
+    aiobotocore 비동기 클라이언트를 사용하므로 네트워크 대기 중에 이벤트 루프를
+    막지 않습니다. 클라이언트(와 커넥션 풀)는 첫 호출 시 생성되어 재사용됩니다.
     """
     
     def __init__(
@@ -77,6 +153,10 @@ class BedrockClient:
             temperature: 온도 설정 (기본값: 설정에서 로드)
             top_p: Top-P 설정 (기본값: 설정에서 로드)
         """
+        # aiobotocore는 import 비용이 커서 클라이언트 생성 시점에 import
+        from aiobotocore.config import AioConfig
+        from aiobotocore.session import get_session
+        
         settings = get_settings()
         bedrock_config = get_bedrock_config()
         aws_config = get_aws_config()
@@ -86,78 +166,280 @@ class BedrockClient:
         self.temperature = temperature or bedrock_config["temperature"]
         self.top_p = top_p or bedrock_config["top_p"]
         
-        # boto3 설정
-        boto_config = BotoConfig(
+        # 기본 파라미터로 호출할 때 사용할 요청 본문 앞부분을 미리 직렬화 (닫는 '}' 제외)
+        self._body_prefix: bytes = orjson.dumps({
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+        })[:-1]
+        
+        # 자체 재시도(일시적 오류 코드 + 끊어진 커넥션)가 켜져 있으면 botocore 재시도는 끄고
+        # 한 계층에서만 재시도 (둘 다 켜면 한 요청이 최대 (1 + 자체 재시도) x 3회까지 호출됨)
+        if settings.bedrock_throttle_retries > 0:
+            retries = {"total_max_attempts": 1, "mode": "standard"}
+        else:
+            retries = {"max_attempts": 3, "mode": "adaptive"}
+        
+        # aiobotocore 설정 (aiohttp 커넥터는 botocore의 tcp_keepalive를 무시하므로
+        # 유휴 커넥션 유지 시간은 connector_args로 지정)
+        boto_config = AioConfig(
             region_name=region_name or aws_config["region_name"],
-            retries={
-                "max_attempts": 3,
-                "mode": "adaptive"
-            },
+            retries=retries,
             connect_timeout=30,
             read_timeout=60,
+            max_pool_connections=settings.aws_max_pool_connections,
+            connector_args={"keepalive_timeout": _KEEPALIVE_TIMEOUT_SECONDS},
         )
         
-        # Bedrock Runtime 클라이언트 생성
+        # 동시 호출 수를 제한하여 트래픽 급증 시 Bedrock이 거절하기 전에 대기시킴
+        self._semaphore = asyncio.Semaphore(settings.bedrock_max_concurrency)
+        self._throttle_retries = settings.bedrock_throttle_retries
+        self._throttle_backoff_seconds = settings.bedrock_throttle_backoff_seconds
+        self._prompt_caching = settings.bedrock_prompt_caching
+        
+        # Bedrock Runtime 클라이언트 설정 (클라이언트는 첫 호출 시 생성)
+        self._client_kwargs: Dict[str, Any] = {
+            "service_name": "bedrock-runtime",
+            "config": boto_config,
+        }
+        
+        # Access Key가 설정된 경우에만 추가
+        if aws_config.get("aws_access_key_id"):
+            self._client_kwargs["aws_access_key_id"] = aws_config["aws_access_key_id"]
+            self._client_kwargs["aws_secret_access_key"] = aws_config["aws_secret_access_key"]
+        
+        self._session = get_session()
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._client = None
+        self._client_lock = asyncio.Lock()
+        # 클라이언트별 사용 중인 호출 수와, 폐기되었지만 사용 중이라 아직 닫지 않은 클라이언트
+        self._in_flight: Dict[Any, int] = {}
+        self._retired: Dict[Any, AsyncExitStack] = {}
+        
+        logger.info(f"Bedrock 클라이언트 초기화 완료: model_id={self.model_id}")
+    
+    async def _get_client(self):
+        """
+        Bedrock Runtime 비동기 클라이언트를 반환합니다.
+        
+        첫 호출 시 클라이언트를 생성하고, 이후에는 같은 클라이언트를 재사용합니다.
+        
+        Returns:
+            Bedrock Runtime 클라이언트
+        
+        Raises:
+            BedrockConnectionError: 클라이언트 생성 실패 시
+        """
+        if self._client is not None:
+            return self._client
+        
+        async with self._client_lock:
+            if self._client is None:
+                try:
+                    exit_stack = AsyncExitStack()
+                    self._client = await exit_stack.enter_async_context(
+                        self._session.create_client(**self._client_kwargs)
+                    )
+                    self._exit_stack = exit_stack
+                except Exception as e:
+                    logger.error(f"Bedrock 클라이언트 초기화 실패: {e}")
+                    raise BedrockConnectionError(f"Bedrock 클라이언트 초기화 실패: {e}")
+        
+        return self._client
+    
+    @asynccontextmanager
+    async def _use_client(self):
+        """
+        호출 동안 클라이언트를 사용 중으로 표시합니다.
+        
+        폐기된 클라이언트는 마지막 사용자가 끝날 때 닫힙니다.
+        
+        Yields:
+            Bedrock Runtime 클라이언트
+        """
+        client = await self._get_client()
+        self._in_flight[client] = self._in_flight.get(client, 0) + 1
         try:
-            client_kwargs = {
-                "service_name": "bedrock-runtime",
-                "config": boto_config,
-            }
-            
-            # Access Key가 설정된 경우에만 추가
-            if aws_config.get("aws_access_key_id"):
-                client_kwargs["aws_access_key_id"] = aws_config["aws_access_key_id"]
-                client_kwargs["aws_secret_access_key"] = aws_config["aws_secret_access_key"]
-            
-            self._client = boto3.client(**client_kwargs)
-            logger.info(f"Bedrock 클라이언트 초기화 완료: model_id={self.model_id}")
-            
+            yield client
+        finally:
+            remaining = self._in_flight[client] - 1
+            if remaining:
+                self._in_flight[client] = remaining
+            else:
+                del self._in_flight[client]
+                exit_stack = self._retired.pop(client, None)
+                if exit_stack is not None:
+                    await self._close_exit_stack(exit_stack)
+    
+    @staticmethod
+    async def _close_exit_stack(exit_stack: AsyncExitStack) -> None:
+        """클라이언트 컨텍스트를 닫습니다 (종료 중 오류는 무시)."""
+        try:
+            await exit_stack.aclose()
         except Exception as e:
-            logger.error(f"Bedrock 클라이언트 초기화 실패: {e}")
-            raise BedrockConnectionError(f"Bedrock 클라이언트 초기화 실패: {e}")
+            logger.debug(f"Bedrock 클라이언트 종료 중 오류 무시: {e}")
+    
+    async def close(self) -> None:
+        """
+        클라이언트와 커넥션 풀을 닫습니다.
+        
+        애플리케이션 종료나 설정 변경 시 사용하며, 폐기 후 닫기를 기다리던
+        클라이언트도 함께 닫습니다. 닫은 뒤에도 다시 호출하면 새 클라이언트가 생성됩니다.
+        """
+        async with self._client_lock:
+            exit_stacks = list(self._retired.values())
+            if self._exit_stack is not None:
+                exit_stacks.append(self._exit_stack)
+            self._client = None
+            self._exit_stack = None
+            self._retired.clear()
+        
+        for exit_stack in exit_stacks:
+            await self._close_exit_stack(exit_stack)
+    
+    async def _invalidate_client(self, client) -> None:
+        """
+        커넥션 오류가 난 클라이언트를 폐기합니다.
+        
+        이미 다른 호출이 교체했으면 아무것도 하지 않습니다. 같은 클라이언트로
+        진행 중인 다른 호출이 있으면 끝날 때까지 닫기를 미루고, 다음 호출부터는
+        새 커넥션 풀을 가진 클라이언트가 생성됩니다.
+        
+        Args:
+            client: 오류가 발생한 클라이언트
+        """
+        async with self._client_lock:
+            if client is None or self._client is not client:
+                return
+            exit_stack = self._exit_stack
+            self._client = None
+            self._exit_stack = None
+            if self._in_flight.get(client):
+                self._retired[client] = exit_stack
+                exit_stack = None
+        
+        logger.warning("오래된 커넥션 감지, Bedrock 클라이언트를 다시 생성합니다.")
+        if exit_stack is not None:
+            await self._close_exit_stack(exit_stack)
+    
+    @asynccontextmanager
+    async def _call_with_retry(self, operation: str, **kwargs):
+        """
+        일시적인 오류 발생 시 지터를 더한 지수 백오프로 재시도하며 클라이언트를 호출합니다.
+        
+        재시도 대상은 _RETRYABLE_ERROR_CODES의 오류 코드, 끊어진 커넥션, 엔드포인트 연결
+        실패이며, 끊어진 커넥션이면 클라이언트를 폐기하고 새 클라이언트로 다시 호출합니다.
+        동시에 거절된 요청들이 같은 시점에 재시도하지 않도록 대기 시간을
+        0 ~ (backoff * 2^(시도-1)) 사이에서 랜덤하게 선택합니다.
+        재시도 대상이 아닌 오류는 대기 없이 바로 전달합니다.
+        이 재시도가 켜져 있으면 botocore 자체 재시도는 꺼져 있습니다.
+        동시에 많은 요청이 거절될 때 로그가 넘치지 않도록 첫 재시도만 WARNING으로 남깁니다.
+        
+        응답 본문을 읽는 동안 클라이언트를 사용 중으로 유지하고, 그 사이 커넥션이
+        끊어지면 클라이언트를 폐기합니다.
+        
+        Args:
+            operation: 호출할 클라이언트 메서드 이름
+            **kwargs: 메서드 인자
+        
+        Yields:
+            메서드 호출 결과
+        
+        Raises:
+            ClientError: 재시도 횟수를 모두 사용했거나 재시도 대상이 아닌 오류인 경우
+            BotoCoreError: 재시도 횟수를 모두 사용한 커넥션 오류 등
+        """
+        attempt = 0
+        while True:
+            async with self._use_client() as client:
+                try:
+                    response = await getattr(client, operation)(**kwargs)
+                except Exception as e:
+                    if isinstance(e, ClientError):
+                        reason = e.response.get("Error", {}).get("Code")
+                        retryable = reason in _RETRYABLE_ERROR_CODES
+                    elif is_stale_connection_error(e):
+                        reason = type(e).__name__
+                        retryable = True
+                        await self._invalidate_client(client)
+                    elif isinstance(e, BotoConnectionError):
+                        # 엔드포인트 연결 실패는 풀 문제가 아니므로 같은 클라이언트로 재시도
+                        reason = type(e).__name__
+                        retryable = True
+                    else:
+                        raise
+                    if not retryable or attempt >= self._throttle_retries:
+                        raise
+                else:
+                    try:
+                        yield response
+                    except Exception as e:
+                        if is_stale_connection_error(e):
+                            await self._invalidate_client(client)
+                        raise
+                    return
+            
+            attempt += 1
+            delay = random.uniform(0, self._throttle_backoff_seconds * (2 ** (attempt - 1)))
+            logger.log(
+                logging.WARNING if attempt == 1 else logging.DEBUG,
+                f"Bedrock {reason}, {delay:.2f}초 후 재시도 "
+                f"({attempt}/{self._throttle_retries})"
+            )
+            await asyncio.sleep(delay)
     
     def _build_messages(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         conversation_history: Optional[List[Dict[str, str]]] = None,
-    ) -> tuple[List[Dict], Optional[str]]:
+    ) -> tuple[List[Dict], Optional[Union[str, List[Dict]]]]:
         """
         Claude 메시지 형식으로 변환
         
+        프롬프트 캐싱이 켜져 있으면 시스템 프롬프트와 마지막 히스토리 메시지를
+        cache_control이 지정된 콘텐츠 블록으로 바꿉니다. 매 턴 동일하게 반복되는
+        앞부분은 캐시에서 읽고 새 메시지만 입력 처리하게 됩니다.
+        
         Args:
             prompt: 사용자 프롬프트
             system_prompt: 시스템 프롬프트 (선택)
-            conversation_history: 대화 히스토리 (선택)
+            conversation_history: 대화 히스토리 (선택, role은 저장 시점에 검증되며
+                내용이 빈 메시지는 제외)
         
         Returns:
-            tuple: (messages 리스트, system 프롬프트)
+            tuple: (messages 리스트, system 프롬프트 또는 콘텐츠 블록 리스트)
         """
-        messages = []
-        
-        # 대화 히스토리 추가
-        if conversation_history:
-            for msg in conversation_history:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                if role in ["user", "assistant"] and content:
-                    messages.append({
-                        "role": role,
-                        "content": content
-                    })
-        
-        # 현재 사용자 메시지 추가
-        messages.append({
-            "role": "user",
-            "content": prompt
-        })
-        
-        return messages, system_prompt
+        # Bedrock은 빈 텍스트 블록을 거부하므로 내용이 빈 히스토리는 제외
+        # (원본 리스트는 변경하지 않음)
+        messages = [m for m in conversation_history or () if m.get("content")]
+        messages.append({"role": "user", "content": prompt})
+        
+        if not self._prompt_caching:
+            return messages, system_prompt
+        
+        if len(messages) > 1:
+            last = messages[-2]
+            messages[-2] = {
+                "role": last["role"],
+                "content": [{
+                    "type": "text",
+                    "text": last["content"],
+                    "cache_control": _CACHE_CONTROL,
+                }],
+            }
+        system = [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": _CACHE_CONTROL,
+        }] if system_prompt else None
+        
+        return messages, system
     
     def _build_request_body(
         self,
         messages: List[Dict],
-        system_prompt: Optional[str] = None,
+        system_prompt: Optional[Union[str, List[Dict]]] = None,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
@@ -167,7 +449,7 @@ class BedrockClient:
         
         Args:
             messages: 메시지 리스트
-            system_prompt: 시스템 프롬프트
+            system_prompt: 시스템 프롬프트 (문자열 또는 콘텐츠 블록 리스트)
             max_tokens: 최대 토큰 수
             temperature: 온도 설정
             top_p: Top-P 설정
@@ -175,26 +457,56 @@ class BedrockClient:
         Returns:
             dict: API 요청 본문
         """
-        body = {
+        # Claude 모델은 temperature와 top_p를 동시에 사용할 수 없음
+        # temperature만 사용
+        return {
             "anthropic_version": "bedrock-2023-05-31",
             "max_tokens": max_tokens or self.max_tokens,
             "messages": messages,
+            "temperature": self.temperature if temperature is None else temperature,
+            # 선택적 파라미터 추가
+            **({"system": system_prompt} if system_prompt else {}),
         }
+    
+    def _encode_request_body(
+        self,
+        messages: List[Dict],
+        system_prompt: Optional[Union[str, List[Dict]]] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+    ) -> bytes:
+        """
+        Bedrock API 요청 본문을 JSON 바이트로 직렬화
         
-        # 선택적 파라미터 추가
-        if system_prompt:
-            body["system"] = system_prompt
+        max_tokens와 temperature가 기본값이면 미리 직렬화한 앞부분에
+        system과 messages만 이어 붙이고, 아니면 전체 본문을 직렬화합니다.
         
-        # Claude 모델은 temperature와 top_p를 동시에 사용할 수 없음
-        # temperature만 사용
-        if temperature is not None:
-            body["temperature"] = temperature
-        else:
-            body["temperature"] = self.temperature
+        Args:
+            messages: 메시지 리스트
+            system_prompt: 시스템 프롬프트 (문자열 또는 콘텐츠 블록 리스트)
+            max_tokens: 최대 토큰 수
+            temperature: 온도 설정
+            top_p: Top-P 설정
+        
+        Returns:
+            bytes: 직렬화된 API 요청 본문
+        """
+        if (not max_tokens or max_tokens == self.max_tokens) and temperature is None:
+            parts = [self._body_prefix]
+            if system_prompt:
+                parts.append(b',"system":')
+                parts.append(orjson.dumps(system_prompt))
+            parts.append(b',"messages":')
+            parts.append(orjson.dumps(messages))
+            parts.append(b"}")
+            return b"".join(parts)
         
-        return body
+        return orjson.dumps(self._build_request_body(
+            messages, system_prompt, max_tokens, temperature, top_p
+        ))
     
-    def invoke(
+    async def invoke(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
@@ -225,39 +537,45 @@ class BedrockClient:
             prompt, system_prompt, conversation_history
         )
         
-        body = self._build_request_body(
+        body = self._encode_request_body(
             messages, system, max_tokens, temperature, top_p
         )
         
         try:
             logger.debug(f"Bedrock 호출 시작: model_id={self.model_id}")
             
-            response = self._client.invoke_model(
+            async with self._semaphore, self._call_with_retry(
+                "invoke_model",
                 modelId=self.model_id,
                 contentType="application/json",
                 accept="application/json",
-                body=json.dumps(body)
-            )
-            
-            response_body = json.loads(response["body"].read())
+                body=body
+            ) as response:
+                async with response["body"] as stream:
+                    response_body = orjson.loads(await stream.read())
             
-            # 응답 파싱
-            content = ""
-            if "content" in response_body and len(response_body["content"]) > 0:
-                content = response_body["content"][0].get("text", "")
+            # 응답 파싱 (정상 응답은 content[0].text에 바로 접근)
+            try:
+                content = response_body["content"][0]["text"]
+            except (KeyError, IndexError, TypeError):
+                content = ""
+            usage = response_body.get("usage") or _EMPTY
             
             result = BedrockResponse(
                 content=content,
                 stop_reason=response_body.get("stop_reason"),
-                input_tokens=response_body.get("usage", {}).get("input_tokens", 0),
-                output_tokens=response_body.get("usage", {}).get("output_tokens", 0),
+                input_tokens=usage.get("input_tokens", 0),
+                output_tokens=usage.get("output_tokens", 0),
+                cache_read_input_tokens=usage.get("cache_read_input_tokens", 0),
+                cache_creation_input_tokens=usage.get("cache_creation_input_tokens", 0),
                 model_id=self.model_id,
             )
             
             logger.debug(
                 f"Bedrock 호출 완료: "
                 f"input_tokens={result.input_tokens}, "
-                f"output_tokens={result.output_tokens}"
+                f"output_tokens={result.output_tokens}, "
+                f"cache_read_input_tokens={result.cache_read_input_tokens}"
             )
             
             return result
@@ -277,6 +595,9 @@ class BedrockClient:
             logger.error(f"Bedrock 연결 오류: {e}")
             raise BedrockConnectionError(f"연결 오류: {e}")
             
+        except BedrockError:
+            raise
+            
         except Exception as e:
             logger.error(f"Bedrock 예상치 못한 오류: {e}")
             raise BedrockError(f"예상치 못한 오류: {e}")
@@ -312,39 +633,46 @@ class BedrockClient:
             prompt, system_prompt, conversation_history
         )
         
-        body = self._build_request_body(
+        body = self._encode_request_body(
             messages, system, max_tokens, temperature, top_p
         )
         
         try:
             logger.debug(f"Bedrock 스트리밍 호출 시작: model_id={self.model_id}")
             
-            response = self._client.invoke_model_with_response_stream(
+            # 스트림이 끝날 때까지 동시 호출 슬롯을 점유
+            async with self._semaphore, self._call_with_retry(
+                "invoke_model_with_response_stream",
                 modelId=self.model_id,
                 contentType="application/json",
                 accept="application/json",
-                body=json.dumps(body)
-            )
-            
-            stream = response.get("body")
-            
-            if stream:
-                for event in stream:
-                    chunk = event.get("chunk")
-                    if chunk:
-                        chunk_data = json.loads(chunk.get("bytes").decode())
-                        
-                        # content_block_delta 이벤트에서 텍스트 추출
-                        if chunk_data.get("type") == "content_block_delta":
-                            delta = chunk_data.get("delta", {})
-                            text = delta.get("text", "")
-                            if text:
-                                yield text
-                        
-                        # message_stop 이벤트 처리
-                        elif chunk_data.get("type") == "message_stop":
-                            logger.debug("Bedrock 스트리밍 완료")
-                            break
+                body=body
+            ) as response:
+                stream = response.get("body")
+                
+                if stream:
+                    try:
+                        async for event in stream:
+                            chunk = event.get("chunk")
+                            if chunk:
+                                # bytes를 디코딩 없이 바로 파싱
+                                chunk_data = orjson.loads(chunk["bytes"])
+                                
+                                event_type = chunk_data.get("type")
+                                
+                                # content_block_delta 이벤트에서 텍스트 추출
+                                if event_type == _TYPE_DELTA:
+                                    text = (chunk_data.get("delta") or _EMPTY).get("text")
+                                    if text:
+                                        yield text
+                                
+                                # message_stop 이벤트 처리
+                                elif event_type == _TYPE_STOP:
+                                    logger.debug("Bedrock 스트리밍 완료")
+                                    break
+                    finally:
+                        # 중간에 종료되어도 응답 스트림을 정리
+                        stream.close()
             
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
@@ -361,6 +689,9 @@ class BedrockClient:
             logger.error(f"Bedrock 연결 오류: {e}")
             raise BedrockConnectionError(f"연결 오류: {e}")
             
+        except BedrockError:
+            raise
+            
         except Exception as e:
             logger.error(f"Bedrock 스트리밍 예상치 못한 오류: {e}")
             raise BedrockError(f"예상치 못한 오류: {e}")
@@ -369,6 +700,9 @@ class BedrockClient:
 # 전역 클라이언트 인스턴스
 _bedrock_client: Optional[BedrockClient] = None
 
+# reset_bedrock_client()가 예약한 종료 태스크 (GC 방지용 참조)
+_closing_tasks: set = set()
+
 
 def get_bedrock_client() -> BedrockClient:
     """
@@ -388,6 +722,34 @@ def reset_bedrock_client() -> None:
     Bedrock 클라이언트 인스턴스 초기화
     
     테스트나 설정 변경 시 사용합니다.
+    실행 중인 이벤트 루프가 있으면 기존 클라이언트의 커넥션 풀 종료를 예약합니다.
     """
     global _bedrock_client
+    client = _bedrock_client
     _bedrock_client = None
+    
+    if client is None:
+        return
+    
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    
+    task = loop.create_task(client.close())
+    _closing_tasks.add(task)
+    task.add_done_callback(_closing_tasks.discard)
+
+
+async def close_bedrock_client() -> None:
+    """
+    전역 Bedrock 클라이언트를 닫고 초기화합니다.
+    
+    애플리케이션 종료 시 커넥션 풀을 정리하기 위해 사용합니다.
+    """
+    global _bedrock_client
+    client = _bedrock_client
+    _bedrock_client = None
+    
+    if client is not None:
+        await client.close()
@@ -6,6 +6,7 @@ Pydantic Settings를 사용하여 타입 안전성과 검증을 제공합니다.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -31,6 +32,12 @@ class Settings(BaseSettings):
         default="us-east-1",
         description="AWS 리전"
     )
+    aws_max_pool_connections: int = Field(
+        default=50,
+        ge=1,
+        le=1000,
+        description="AWS 클라이언트 HTTP 커넥션 풀 크기 (동시 요청 수)"
+    )
     
     # AWS Bedrock 설정
     bedrock_model_id: str = Field(
@@ -51,6 +58,16 @@ class Settings(BaseSettings):
         default="",
         description="Bedrock Knowledge Base ID"
     )
+    kb_cache_ttl_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="Knowledge Base 응답 캐시 만료 시간 (초, 0이면 비활성화, 문서 동기화 후 최대 이 시간 동안 이전 응답 사용)"
+    )
+    kb_cache_max_entries: int = Field(
+        default=512,
+        ge=0,
+        description="Knowledge Base 응답 캐시 최대 항목 수 (0이면 비활성화)"
+    )
     
     # S3 벡터 저장소 설정
     s3_bucket_name: str = Field(
@@ -109,6 +126,33 @@ class Settings(BaseSettings):
         le=1.0,
         description="최소 유사도 임계값"
     )
+    max_history_messages: int = Field(
+        default=20,
+        ge=0,
+        le=200,
+        description="LLM 컨텍스트에 포함할 최근 대화 메시지 수 (0이면 제한 없음)"
+    )
+    
+    # 스트리밍 설정
+    stream_flush_interval_ms: int = Field(
+        default=20,
+        ge=0,
+        le=1000,
+        description="스트리밍 청크 전송 주기 (밀리초)"
+    )
+    stream_flush_chars: int = Field(
+        default=512,
+        ge=1,
+        le=65536,
+        description="스트리밍 청크 즉시 전송 기준 크기 (문자 수)"
+    )
+    
+    # 세션 설정
+    session_idle_ttl_seconds: int = Field(
+        default=3600,
+        ge=60,
+        description="유휴 Socket.IO 세션 상태를 메모리에서 정리하기까지의 시간 (초)"
+    )
     
     # 로깅 설정
     log_level: str = Field(
@@ -153,6 +197,28 @@ class Settings(BaseSettings):
         le=1.0,
         description="LLM Top-P 설정"
     )
+    bedrock_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="Bedrock 모델 동시 호출 수 상한 (초과 요청은 대기)"
+    )
+    bedrock_throttle_retries: int = Field(
+        default=2,
+        ge=0,
+        le=10,
+        description="Throttling, 끊어진 커넥션 등 일시적인 Bedrock 오류 발생 시 재시도 횟수 (0이면 botocore adaptive 재시도 사용)"
+    )
+    bedrock_throttle_backoff_seconds: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=30.0,
+        description="Throttling 재시도 기본 대기 시간 (초, 지수 증가 + 랜덤 지터)"
+    )
+    bedrock_prompt_caching: bool = Field(
+        default=False,
+        description="Bedrock 프롬프트 캐싱 사용 여부 (시스템 프롬프트와 대화 히스토리에 cache_control 지정)"
+    )
     
     class Config:
         """Pydantic 설정"""
@@ -192,14 +258,24 @@ def reload_settings() -> Settings:
     """
     global _settings
     _settings = Settings()
+    
+    # 이전 설정으로 만든 설정 딕셔너리 캐시 무효화
+    get_aws_config.cache_clear()
+    get_bedrock_config.cache_clear()
+    get_rag_config.cache_clear()
+    get_s3_config.cache_clear()
     return _settings
 
 
 # 편의를 위한 설정 접근 함수들
+@lru_cache(maxsize=1)
 def get_aws_config() -> dict:
     """
     AWS 관련 설정을 딕셔너리로 반환합니다.
     
+    한 번 만든 딕셔너리를 캐시하여 재사용하므로 반환값을 변경하지 마세요.
+    reload_settings() 호출 시 캐시가 초기화됩니다.
+    
     Returns:
         dict: AWS 설정 딕셔너리
     """
@@ -216,10 +292,14 @@ def get_aws_config() -> dict:
     return config
 
 
+@lru_cache(maxsize=1)
 def get_bedrock_config() -> dict:
     """
     Bedrock 관련 설정을 딕셔너리로 반환합니다.
     
+    한 번 만든 딕셔너리를 캐시하여 재사용하므로 반환값을 변경하지 마세요.
+    reload_settings() 호출 시 캐시가 초기화됩니다.
+    
     Returns:
         dict: Bedrock 설정 딕셔너리
     """
@@ -233,10 +313,14 @@ def get_bedrock_config() -> dict:
     }
 
 
+@lru_cache(maxsize=1)
 def get_rag_config() -> dict:
     """
     RAG 관련 설정을 딕셔너리로 반환합니다.
     
+    한 번 만든 딕셔너리를 캐시하여 재사용하므로 반환값을 변경하지 마세요.
+    reload_settings() 호출 시 캐시가 초기화됩니다.
+    
     Returns:
         dict: RAG 설정 딕셔너리
     """
@@ -249,10 +333,14 @@ def get_rag_config() -> dict:
     }
 
 
+@lru_cache(maxsize=1)
 def get_s3_config() -> dict:
     """
     S3 관련 설정을 딕셔너리로 반환합니다.
     
+    한 번 만든 딕셔너리를 캐시하여 재사용하므로 반환값을 변경하지 마세요.
+    reload_settings() 호출 시 캐시가 초기화됩니다.
+    
     Returns:
         dict: S3 설정 딕셔너리
     """
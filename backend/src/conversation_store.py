@@ -5,20 +5,45 @@
 각 세션은 고유한 ID로 식별되며, 대화 메시지들을 순서대로 저장합니다.
 """
 
+import itertools
 import logging
+import secrets
+import time
 import uuid
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Optional
 from dataclasses import dataclass, field
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from threading import Lock
 
+from .utils.exceptions import ValidationError
+from .utils.timestamp import format_utc_ns
+
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# ID 생성용 프로세스별 랜덤 접두사와 카운터 (next()는 GIL 하에서 원자적)
+_id_prefix = secrets.token_hex(3)
+_message_id_counter = itertools.count()
+_session_id_counter = itertools.count()
+
+# LLM 컨텍스트로 전달 가능한 메시지 역할
+_ALLOWED_ROLES = frozenset(("user", "assistant"))
+
+# 세션별 Lock 스트라이프 수 (2의 거듭제곱이어야 함)
+_LOCK_STRIPES = 64
+
 
-@dataclass
+def _parse_timestamp_ns(timestamp: str) -> int:
+    """ISO 8601 타임스탬프를 나노초 단위 Unix 시각으로 변환합니다 (타임존이 없으면 UTC)."""
+    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp()) * 1_000_000_000 + dt.microsecond * 1000
+
+
+@dataclass(slots=True)
 class Message:
     """
     대화 메시지 데이터 클래스
@@ -28,7 +53,8 @@ class Message:
         session_id: 세션 ID
         role: 메시지 역할 (user, assistant)
         content: 메시지 내용
-        timestamp: 메시지 생성 시간
+        timestamp_ns: 메시지 생성 시간 (Unix epoch 나노초)
+        timestamp: 메시지 생성 시간 (ISO 8601, 처음 접근할 때 변환)
         sources: 출처 정보 (RAG 응답의 경우)
         metadata: 추가 메타데이터
     """
@@ -36,9 +62,22 @@ class Message:
     session_id: str
     role: str  # "user" 또는 "assistant"
     content: str
-    timestamp: str
+    timestamp_ns: int
     sources: Optional[List[Dict]] = None
     metadata: Optional[Dict] = None
+    _llm_dict: Dict[str, str] = field(init=False, repr=False, compare=False)
+    _timestamp: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # LLM 컨텍스트용 dict를 생성 시 한 번만 만들어 재사용 (읽기 전용으로 사용)
+        self._llm_dict = {"role": self.role, "content": self.content}
+    
+    @property
+    def timestamp(self) -> str:
+        """메시지 생성 시간 (ISO 8601)"""
+        if self._timestamp is None:
+            self._timestamp = format_utc_ns(self.timestamp_ns)
+        return self._timestamp
     
     def to_dict(self) -> Dict:
         """메시지를 딕셔너리로 변환"""
@@ -58,34 +97,50 @@ class Message:
     @classmethod
     def from_dict(cls, data: Dict) -> "Message":
         """딕셔너리에서 메시지 생성"""
-        return cls(
+        timestamp = data.get("timestamp")
+        message = cls(
             id=data.get("id", str(uuid.uuid4())),
             session_id=data.get("session_id", ""),
             role=data.get("role", "user"),
             content=data.get("content", ""),
-            timestamp=data.get("timestamp", datetime.utcnow().isoformat()),
+            timestamp_ns=_parse_timestamp_ns(timestamp) if timestamp else time.time_ns(),
             sources=data.get("sources"),
             metadata=data.get("metadata"),
         )
+        # 원본 타임스탬프 문자열 유지
+        message._timestamp = timestamp
+        return message
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """
     대화 세션 데이터 클래스
     
     Attributes:
         id: 세션 고유 ID
-        created_at: 세션 생성 시간
-        updated_at: 세션 마지막 업데이트 시간
-        messages: 세션의 메시지 리스트
+        created_at_ns: 세션 생성 시간 (Unix epoch 나노초)
+        updated_at_ns: 세션 마지막 업데이트 시간 (Unix epoch 나노초)
+        messages: 세션의 메시지 큐 (최대 개수 초과 시 오래된 메시지부터 자동 제거)
         metadata: 세션 메타데이터
+        recently_used: 마지막 제거 검사 이후 사용 여부 (근사 LRU용)
     """
     id: str
-    created_at: str
-    updated_at: str
-    messages: List[Message] = field(default_factory=list)
+    created_at_ns: int
+    updated_at_ns: int
+    messages: Deque[Message] = field(default_factory=deque)
     metadata: Optional[Dict] = None
+    recently_used: bool = field(default=True, repr=False)
+    
+    @property
+    def created_at(self) -> str:
+        """세션 생성 시간 (ISO 8601)"""
+        return format_utc_ns(self.created_at_ns)
+    
+    @property
+    def updated_at(self) -> str:
+        """세션 마지막 업데이트 시간 (ISO 8601)"""
+        return format_utc_ns(self.updated_at_ns)
     
     def to_dict(self) -> Dict:
         """세션을 딕셔너리로 변환"""
@@ -103,7 +158,12 @@ class ConversationStore:
     대화 히스토리 저장소 클래스
     
     메모리 기반으로 세션별 대화 히스토리를 관리합니다.
-    스레드 안전성을 위해 Lock을 사용합니다.
+    스레드 안전성을 위해 세션 ID 해시로 나눈 스트라이프 Lock을 사용하고,
+    세션 딕셔너리 구조 변경(생성, 삭제, 제거)은 별도의 구조 Lock으로 보호합니다.
+    Lock 순서는 항상 스트라이프 Lock → 구조 Lock입니다.
+    
+    조회와 메시지 추가는 스트라이프 Lock만 사용하고 세션에 사용 표시만 남깁니다.
+    세션 수가 상한을 넘으면 second-chance 방식으로 최근 사용되지 않은 세션부터 제거합니다.
     """
     
     def __init__(self, max_sessions: int = 1000, max_messages_per_session: int = 100):
@@ -117,7 +177,8 @@ class ConversationStore:
         self._sessions: OrderedDict[str, Session] = OrderedDict()
         self._max_sessions = max_sessions
         self._max_messages_per_session = max_messages_per_session
-        self._lock = Lock()
+        self._stripes = [Lock() for _ in range(_LOCK_STRIPES)]
+        self._struct_lock = Lock()
         
         logger.info(
             f"ConversationStore 초기화: "
@@ -127,22 +188,75 @@ class ConversationStore:
     
     def _generate_message_id(self) -> str:
         """고유한 메시지 ID 생성"""
-        return f"msg_{uuid.uuid4().hex[:12]}"
+        return f"msg_{_id_prefix}{next(_message_id_counter):09x}"
     
     def _generate_session_id(self) -> str:
         """고유한 세션 ID 생성"""
-        return f"session_{uuid.uuid4().hex[:12]}"
+        return f"session_{_id_prefix}{next(_session_id_counter):09x}"
     
-    def _get_current_timestamp(self) -> str:
-        """현재 UTC 타임스탬프 반환"""
-        return datetime.utcnow().isoformat() + "Z"
+    def _lock_for(self, session_id: str) -> Lock:
+        """세션 ID에 해당하는 스트라이프 Lock 반환"""
+        return self._stripes[hash(session_id) & (_LOCK_STRIPES - 1)]
     
     def _evict_old_sessions(self) -> None:
-        """오래된 세션 제거 (LRU 방식)"""
-        while len(self._sessions) > self._max_sessions:
-            oldest_session_id = next(iter(self._sessions))
-            del self._sessions[oldest_session_id]
-            logger.debug(f"오래된 세션 제거: {oldest_session_id}")
+        """
+        오래된 세션 제거 (호출자가 _struct_lock을 보유해야 함)
+        
+        앞쪽 세션이 최근 사용되었으면 표시를 지우고 맨 뒤로 보냅니다.
+        Lock 순서를 지키기 위해 스트라이프 Lock은 기다리지 않고 시도만 하며,
+        다른 스레드가 사용 중인 세션도 맨 뒤로 보냅니다.
+        """
+        attempts = 2 * len(self._sessions)
+        while len(self._sessions) > self._max_sessions and attempts > 0:
+            attempts -= 1
+            session_id, session = next(iter(self._sessions.items()))
+            
+            lock = self._lock_for(session_id)
+            if session.recently_used or not lock.acquire(blocking=False):
+                session.recently_used = False
+                self._sessions.move_to_end(session_id)
+                continue
+            
+            try:
+                del self._sessions[session_id]
+            finally:
+                lock.release()
+            logger.debug(f"오래된 세션 제거: {session_id}")
+    
+    def _create_session_locked(self, session_id: Optional[str], metadata: Optional[Dict] = None) -> Session:
+        """
+        세션 생성 (호출자가 _struct_lock을 보유해야 함)
+        
+        Args:
+            session_id: 세션 ID (None이면 자동 생성)
+            metadata: 세션 메타데이터 (선택)
+        
+        Returns:
+            Session: 생성되었거나 이미 존재하는 세션
+        """
+        if session_id is None:
+            session_id = self._generate_session_id()
+        
+        # 이미 존재하는 세션이면 반환
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.recently_used = True
+            return session
+        
+        now_ns = time.time_ns()
+        session = Session(
+            id=session_id,
+            created_at_ns=now_ns,
+            updated_at_ns=now_ns,
+            messages=deque(maxlen=self._max_messages_per_session),
+            metadata=metadata,
+        )
+        
+        self._sessions[session_id] = session
+        self._evict_old_sessions()
+        
+        logger.info(f"새 세션 생성: {session_id}")
+        return session
     
     def create_session(self, session_id: Optional[str] = None, metadata: Optional[Dict] = None) -> Session:
         """
@@ -155,30 +269,8 @@ class ConversationStore:
         Returns:
             Session: 생성된 세션
         """
-        with self._lock:
-            if session_id is None:
-                session_id = self._generate_session_id()
-            
-            # 이미 존재하는 세션이면 반환
-            if session_id in self._sessions:
-                # LRU 업데이트: 세션을 맨 뒤로 이동
-                self._sessions.move_to_end(session_id)
-                return self._sessions[session_id]
-            
-            now = self._get_current_timestamp()
-            session = Session(
-                id=session_id,
-                created_at=now,
-                updated_at=now,
-                messages=[],
-                metadata=metadata,
-            )
-            
-            self._sessions[session_id] = session
-            self._evict_old_sessions()
-            
-            logger.info(f"새 세션 생성: {session_id}")
-            return session
+        with self._struct_lock:
+            return self._create_session_locked(session_id, metadata)
     
     def get_session(self, session_id: str) -> Optional[Session]:
         """
@@ -190,11 +282,10 @@ class ConversationStore:
         Returns:
             Optional[Session]: 세션 (없으면 None)
         """
-        with self._lock:
+        with self._lock_for(session_id):
             session = self._sessions.get(session_id)
             if session:
-                # LRU 업데이트
-                self._sessions.move_to_end(session_id)
+                session.recently_used = True
             return session
     
     def get_or_create_session(self, session_id: str, metadata: Optional[Dict] = None) -> Session:
@@ -208,10 +299,9 @@ class ConversationStore:
         Returns:
             Session: 세션
         """
-        session = self.get_session(session_id)
-        if session is None:
-            session = self.create_session(session_id, metadata)
-        return session
+        # 조회와 생성을 한 번의 Lock 획득으로 처리
+        with self._struct_lock:
+            return self._create_session_locked(session_id, metadata)
     
     def add_message(
         self,
@@ -233,13 +323,20 @@ class ConversationStore:
         
         Returns:
             Message: 추가된 메시지
+        
+        Raises:
+            ValidationError: 허용되지 않는 역할인 경우
         """
-        with self._lock:
-            # 세션이 없으면 생성
-            if session_id not in self._sessions:
-                self.create_session(session_id)
-            
-            session = self._sessions[session_id]
+        # 저장 시점에 한 번만 검증하여 히스토리 소비자가 필터링 없이 사용할 수 있게 함
+        if role not in _ALLOWED_ROLES:
+            raise ValidationError(f"허용되지 않는 메시지 역할입니다: {role}", field="role")
+        
+        with self._lock_for(session_id):
+            # 세션이 없으면 생성 (구조 Lock은 한 번만 획득)
+            session = self._sessions.get(session_id)
+            if session is None:
+                with self._struct_lock:
+                    session = self._create_session_locked(session_id)
             
             # 메시지 생성
             message = Message(
@@ -247,22 +344,15 @@ class ConversationStore:
                 session_id=session_id,
                 role=role,
                 content=content,
-                timestamp=self._get_current_timestamp(),
+                timestamp_ns=time.time_ns(),
                 sources=sources,
                 metadata=metadata,
             )
             
-            # 메시지 추가
+            # 메시지 추가 (최대 메시지 수 초과 시 deque가 가장 오래된 메시지를 제거)
             session.messages.append(message)
-            session.updated_at = message.timestamp
-            
-            # 최대 메시지 수 초과 시 오래된 메시지 제거
-            while len(session.messages) > self._max_messages_per_session:
-                removed = session.messages.pop(0)
-                logger.debug(f"오래된 메시지 제거: {removed.id}")
-            
-            # LRU 업데이트
-            self._sessions.move_to_end(session_id)
+            session.updated_at_ns = message.timestamp_ns
+            session.recently_used = True
             
             logger.debug(f"메시지 추가: session={session_id}, role={role}, id={message.id}")
             return message
@@ -271,7 +361,6 @@ class ConversationStore:
         self,
         session_id: str,
         limit: Optional[int] = None,
-        include_system: bool = False,
     ) -> List[Message]:
         """
         세션의 메시지 목록 조회
@@ -279,21 +368,17 @@ class ConversationStore:
         Args:
             session_id: 세션 ID
             limit: 반환할 최대 메시지 수 (최근 메시지부터)
-            include_system: 시스템 메시지 포함 여부
         
         Returns:
             List[Message]: 메시지 리스트
         """
-        with self._lock:
+        with self._lock_for(session_id):
             session = self._sessions.get(session_id)
             if session is None:
                 return []
             
-            messages = session.messages
-            
-            # 시스템 메시지 필터링
-            if not include_system:
-                messages = [m for m in messages if m.role != "system"]
+            # 저장 시점에 role이 user/assistant로 검증되므로 필터링 없이 복사
+            messages = list(session.messages)
             
             # 최근 메시지만 반환
             if limit is not None and limit > 0:
@@ -314,13 +399,10 @@ class ConversationStore:
             limit: 반환할 최대 메시지 수
         
         Returns:
-            List[Dict[str, str]]: 대화 히스토리 (role, content 형식)
+            List[Dict[str, str]]: 대화 히스토리 (role, content 형식, 읽기 전용)
         """
         messages = self.get_messages(session_id, limit)
-        return [
-            {"role": msg.role, "content": msg.content}
-            for msg in messages
-        ]
+        return [msg._llm_dict for msg in messages]
     
     def clear_session(self, session_id: str) -> bool:
         """
@@ -332,13 +414,13 @@ class ConversationStore:
         Returns:
             bool: 성공 여부
         """
-        with self._lock:
+        with self._lock_for(session_id):
             session = self._sessions.get(session_id)
             if session is None:
                 return False
             
             session.messages.clear()
-            session.updated_at = self._get_current_timestamp()
+            session.updated_at_ns = time.time_ns()
             
             logger.info(f"세션 메시지 삭제: {session_id}")
             return True
@@ -353,7 +435,8 @@ class ConversationStore:
         Returns:
             bool: 성공 여부
         """
-        with self._lock:
+        # 메시지 추가와 겹치지 않도록 스트라이프 Lock → 구조 Lock 순서로 획득
+        with self._lock_for(session_id), self._struct_lock:
             if session_id in self._sessions:
                 del self._sessions[session_id]
                 logger.info(f"세션 삭제: {session_id}")
@@ -367,7 +450,7 @@ class ConversationStore:
         Returns:
             List[Dict]: 세션 정보 리스트 (id, created_at, updated_at, message_count)
         """
-        with self._lock:
+        with self._struct_lock:
             return [
                 {
                     "id": session.id,
@@ -380,12 +463,12 @@ class ConversationStore:
     
     def get_session_count(self) -> int:
         """현재 세션 수 반환"""
-        with self._lock:
+        with self._struct_lock:
             return len(self._sessions)
     
     def get_total_message_count(self) -> int:
         """전체 메시지 수 반환"""
-        with self._lock:
+        with self._struct_lock:
             return sum(len(s.messages) for s in self._sessions.values())
 
 
@@ -5,8 +5,10 @@
 from .database import (
     init_db,
     get_connection,
+    close_all_connections,
     create_session,
     save_message,
+    save_messages_bulk,
     get_session_messages,
     get_session_history,
     delete_session,
@@ -16,8 +18,10 @@ from .database import (
 __all__ = [
     "init_db",
     "get_connection",
+    "close_all_connections",
     "create_session",
     "save_message",
+    "save_messages_bulk",
     "get_session_messages",
     "get_session_history",
     "delete_session",
@@ -4,15 +4,20 @@ SQLite 데이터베이스 모듈
 대화 히스토리를 SQLite에 저장하고 관리합니다.
 """
 
+import atexit
 import sqlite3
-import json
-from datetime import datetime, timezone
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 from pathlib import Path
 from contextlib import contextmanager
+from functools import lru_cache
+
+import orjson
 
 from ..config import get_settings
 from ..utils.logger import get_logger
+from ..utils.timestamp import utc_now_iso
 
 
 logger = get_logger(__name__)
@@ -21,29 +26,197 @@ logger = get_logger(__name__)
 # 데이터베이스 파일 경로
 DB_PATH = Path("data/chat_history.db")
 
+# 연결마다 적용하는 PRAGMA
+# WAL 모드에서는 synchronous=NORMAL이어도 커밋마다 fsync하지 않으면서 DB 일관성이 보장됨
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # 약 64MB
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA foreign_keys=ON",  # 세션 삭제 시 메시지 CASCADE 삭제
+)
+
+# 새 DB 파일의 페이지 크기 (바이트)
+_PAGE_SIZE = 8192
+
+# 연결별 준비된 문장(prepared statement) 캐시 크기
+# 연결을 재사용하므로 같은 SQL은 한 번만 파싱·컴파일됨 (SQL 문자열이 캐시 키)
+_CACHED_STATEMENTS = 256
+
+# 여러 함수에서 공유하는 쓰기 SQL
+# 세션 updated_at은 messages의 AFTER INSERT 트리거가 갱신함 (init_db 참고)
+_ENSURE_SESSION_SQL = """
+    INSERT INTO sessions (session_id, created_at, updated_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(session_id) DO NOTHING
+"""
+# message_id는 한 번만 생성되므로 중복 시 기존 행을 지우고 다시 쓰지 않고 무시
+_INSERT_MESSAGE_SQL = """
+    INSERT INTO messages
+    (message_id, session_id, role, content, sources, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(message_id) DO NOTHING
+"""
 
+
+@lru_cache(maxsize=1)
 def get_db_path() -> Path:
-    """데이터베이스 파일 경로를 반환합니다."""
+    """
+    데이터베이스 파일 경로를 반환합니다.
+    
+    연결마다 설정 조회와 mkdir 시스템 호출을 반복하지 않도록 첫 호출 결과를 캐시합니다.
+    실행 중 db_path 설정을 바꿨다면 get_db_path.cache_clear()를 호출하세요.
+    """
     settings = get_settings()
     db_path = Path(getattr(settings, 'db_path', 'data/chat_history.db'))
     db_path.parent.mkdir(parents=True, exist_ok=True)
     return db_path
 
 
+# 스레드별 연결 캐시 (페이지 캐시와 파싱된 스키마를 호출 간에 재사용)
+_local = threading.local()
+_connections: List[sqlite3.Connection] = []
+_connections_lock = threading.Lock()
+# close_all_connections() 호출 시 증가하여 스레드별 캐시를 무효화
+_generation = 0
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
+    """PRAGMA를 적용한 새 연결을 열고 종료 시 닫을 수 있도록 등록합니다."""
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        cached_statements=_CACHED_STATEMENTS,
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    
+    with _connections_lock:
+        _connections.append(conn)
+    return conn
+
+
 @contextmanager
 def get_connection():
-    """데이터베이스 연결을 반환하는 컨텍스트 매니저."""
-    conn = sqlite3.connect(get_db_path(), check_same_thread=False)
-    conn.row_factory = sqlite3.Row
+    """
+    데이터베이스 연결을 반환하는 컨텍스트 매니저.
+    
+    연결은 스레드마다 하나씩 열어 프로세스가 끝날 때까지 재사용합니다.
+    블록에서 예외가 발생하면 커밋되지 않은 변경을 롤백합니다.
+    """
+    db_path = get_db_path()
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != db_path or _local.generation != _generation:
+        conn = _open_connection(db_path)
+        _local.conn = conn
+        _local.path = db_path
+        _local.generation = _generation
+    
     try:
         yield conn
-    finally:
-        conn.close()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def close_all_connections() -> None:
+    """
+    열려 있는 모든 스레드별 연결을 닫습니다.
+    
+    애플리케이션 종료 시 호출되며, 이후 호출에서는 새 연결이 열립니다.
+    """
+    global _generation
+    with _connections_lock:
+        _generation += 1
+        connections = list(_connections)
+        _connections.clear()
+    
+    for conn in connections:
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"DB 연결 종료 중 오류 무시: {e}")
+
+
+atexit.register(close_all_connections)
+
+
+# 세션 메시지 조회 결과 캐시: 세션 ID -> (조회 토큰, 메시지 목록)
+# 메시지가 None이면 조회 중인 자리표시 항목이며, 쓰기는 항목을 제거하여 무효화
+# 이 프로세스의 쓰기만 무효화하므로 DB를 단일 프로세스에서 사용한다고 가정
+_SESSION_CACHE_MAX_ENTRIES = 256
+_session_cache: "OrderedDict[str, Tuple[object, Optional[List[dict]]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _invalidate_session_cache(*session_ids: str) -> None:
+    """쓰기가 커밋된 세션의 캐시 항목(조회 중 자리표시 포함)을 제거합니다."""
+    with _cache_lock:
+        for session_id in session_ids:
+            _session_cache.pop(session_id, None)
+
+
+# 메시지 테이블 스키마 (세션 삭제 시 메시지도 함께 삭제)
+_MESSAGES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        message_id TEXT UNIQUE NOT NULL,
+        session_id TEXT NOT NULL,
+        role TEXT NOT NULL,
+        content TEXT NOT NULL,
+        sources TEXT,
+        timestamp TEXT NOT NULL,
+        FOREIGN KEY (session_id) REFERENCES sessions(session_id) ON DELETE CASCADE
+    )
+"""
+
+
+def _migrate_messages_cascade(conn: sqlite3.Connection) -> None:
+    """
+    ON DELETE CASCADE가 없는 기존 messages 테이블을 새 스키마로 다시 만듭니다.
+    
+    SQLite는 외래 키 변경을 지원하지 않으므로 새 테이블로 복사한 뒤 교체합니다.
+    세션 행이 없는 메시지가 있으면 세션을 먼저 만들어 외래 키 검사를 통과시킵니다.
+    """
+    foreign_keys = conn.execute("PRAGMA foreign_key_list(messages)").fetchall()
+    if not foreign_keys or any(fk["on_delete"] == "CASCADE" for fk in foreign_keys):
+        return
+    
+    logger.info("messages 테이블을 ON DELETE CASCADE 스키마로 마이그레이션합니다.")
+    with conn:
+        conn.execute("""
+            INSERT INTO sessions (session_id, created_at, updated_at)
+            SELECT session_id, MIN(timestamp), MAX(timestamp)
+            FROM messages
+            GROUP BY session_id
+            ON CONFLICT(session_id) DO NOTHING
+        """)
+        conn.execute(_MESSAGES_TABLE_SQL.format(table="messages_new"))
+        conn.execute("""
+            INSERT INTO messages_new
+            (id, message_id, session_id, role, content, sources, timestamp)
+            SELECT id, message_id, session_id, role, content, sources, timestamp
+            FROM messages
+        """)
+        # 기존 인덱스와 트리거는 테이블과 함께 삭제되며 init_db에서 다시 생성됨
+        conn.execute("DROP TABLE messages")
+        conn.execute("ALTER TABLE messages_new RENAME TO messages")
 
 
 def init_db():
     """데이터베이스 테이블을 초기화합니다."""
     with get_connection() as conn:
+        # 새 DB 파일이면 스키마 생성과 WAL 전환 전에 페이지 크기를 8KB로 설정
+        # (짧은 대화를 반복해서 읽는 워크로드에서 세션당 읽는 페이지 수 감소,
+        #  기존 DB는 VACUUM 없이 바꿀 수 없으므로 그대로 둠)
+        if conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+            conn.execute(f"PRAGMA page_size={_PAGE_SIZE}")
+        
+        # WAL 모드는 DB 파일에 영구 저장되므로 시작 시 한 번만 설정
+        # (쓰기 중에도 읽기가 막히지 않고, 롤백 저널 fsync가 없어짐)
+        conn.execute("PRAGMA journal_mode=WAL")
+        
         cursor = conn.cursor()
         
         # 세션 테이블
@@ -56,39 +229,59 @@ def init_db():
         """)
         
         # 메시지 테이블
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS messages (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                message_id TEXT UNIQUE NOT NULL,
-                session_id TEXT NOT NULL,
-                role TEXT NOT NULL,
-                content TEXT NOT NULL,
-                sources TEXT,
-                timestamp TEXT NOT NULL,
-                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-            )
-        """)
+        _migrate_messages_cascade(conn)
+        cursor.execute(_MESSAGES_TABLE_SQL.format(table="messages"))
         
         # 인덱스 생성
+        # 인덱스 항목에는 rowid(id)가 포함되므로 session_id 범위 검색이 곧 id 순서이며,
+        # ORDER BY id에 별도 정렬이 필요 없음
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_messages_session 
             ON messages(session_id)
         """)
         
+        # 세션별 첫 사용자 메시지 조회용 (session_id, role, id 순서)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_messages_session_role
+            ON messages(session_id, role)
+        """)
+        
+        # 메시지 저장 시 세션 업데이트 시간 갱신 (별도 UPDATE 문 왕복 없이 같은 문장 안에서 처리)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_messages_touch_session
+            AFTER INSERT ON messages
+            BEGIN
+                UPDATE sessions SET updated_at = NEW.timestamp
+                WHERE session_id = NEW.session_id;
+            END
+        """)
+        
         conn.commit()
         logger.info("데이터베이스 초기화 완료")
 
 
-def create_session(session_id: str) -> None:
-    """새 세션을 생성합니다."""
-    now = datetime.now(timezone.utc).isoformat()
+def create_session(
+    session_id: str,
+    conn: Optional[sqlite3.Connection] = None,
+    now: Optional[str] = None,
+) -> None:
+    """
+    새 세션을 생성합니다.
+    
+    Args:
+        session_id: 세션 ID
+        conn: 사용할 연결 (지정하면 호출자의 트랜잭션 안에서 실행하고 커밋하지 않음)
+        now: 생성 시각 (ISO 8601, 호출자가 이미 구한 값이 있으면 재사용)
+    """
+    if now is None:
+        now = utc_now_iso()
+    
+    if conn is not None:
+        conn.execute(_ENSURE_SESSION_SQL, (session_id, now, now))
+        return
     
     with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR IGNORE INTO sessions (session_id, created_at, updated_at)
-            VALUES (?, ?, ?)
-        """, (session_id, now, now))
+        conn.execute(_ENSURE_SESSION_SQL, (session_id, now, now))
         conn.commit()
 
 
@@ -102,35 +295,105 @@ def save_message(
 ) -> None:
     """메시지를 저장합니다."""
     if timestamp is None:
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = utc_now_iso()
     
-    sources_json = json.dumps(sources, ensure_ascii=False) if sources else None
+    # orjson은 UTF-8 문자를 이스케이프하지 않으므로 ensure_ascii=False와 같은 결과
+    sources_json = orjson.dumps(sources).decode() if sources else None
     
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        
-        # 세션이 없으면 생성
-        create_session(session_id)
+    # 세션 생성/갱신과 메시지 저장을 한 트랜잭션(커밋 1회)으로 처리
+    with get_connection() as conn, conn:
+        # 세션이 없으면 생성 (업데이트 시간은 메시지 INSERT 트리거가 갱신)
+        conn.execute(_ENSURE_SESSION_SQL, (session_id, timestamp, timestamp))
         
         # 메시지 저장
-        cursor.execute("""
-            INSERT OR REPLACE INTO messages 
-            (message_id, session_id, role, content, sources, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (message_id, session_id, role, content, sources_json, timestamp))
-        
-        # 세션 업데이트 시간 갱신
-        cursor.execute("""
-            UPDATE sessions SET updated_at = ? WHERE session_id = ?
-        """, (timestamp, session_id))
+        conn.execute(
+            _INSERT_MESSAGE_SQL,
+            (message_id, session_id, role, content, sources_json, timestamp),
+        )
+    
+    _invalidate_session_cache(session_id)
+
+
+def save_messages_bulk(rows: List[dict]) -> None:
+    """
+    여러 메시지를 하나의 트랜잭션으로 저장합니다.
+    
+    한 번의 대화 턴(사용자 메시지 + AI 응답)을 DB 왕복 한 번에 기록할 때 사용합니다.
+    
+    Args:
+        rows: save_message와 같은 키(message_id, session_id, role, content,
+            sources, timestamp)를 가진 메시지 딕셔너리 목록
+    """
+    if not rows:
+        return
+    
+    now = utc_now_iso()
+    params = []
+    session_updates: dict = {}
+    for row in rows:
+        timestamp = row.get("timestamp") or now
+        sources = row.get("sources")
+        params.append((
+            row["message_id"],
+            row["session_id"],
+            row["role"],
+            row["content"],
+            orjson.dumps(sources).decode() if sources else None,
+            timestamp,
+        ))
+        session_updates[row["session_id"]] = timestamp
+    
+    # 연결 객체를 트랜잭션 컨텍스트로 사용 (성공 시 커밋, 예외 시 롤백)
+    with get_connection() as conn, conn:
+        # 세션이 없으면 생성 (업데이트 시간은 메시지 INSERT 트리거가 갱신)
+        conn.executemany(
+            _ENSURE_SESSION_SQL,
+            [(sid, ts, ts) for sid, ts in session_updates.items()],
+        )
         
-        conn.commit()
+        # 메시지 저장
+        conn.executemany(_INSERT_MESSAGE_SQL, params)
+    
+    _invalidate_session_cache(*session_updates)
 
 
 def get_session_messages(session_id: str) -> List[dict]:
-    """세션의 모든 메시지를 조회합니다."""
+    """
+    세션의 모든 메시지를 조회합니다.
+    
+    마지막 쓰기 이후 같은 세션을 다시 조회하면 DB 대신 캐시된 결과를 반환합니다.
+    반환된 메시지 딕셔너리는 캐시와 공유되므로 변경하지 마세요.
+    """
+    with _cache_lock:
+        entry = _session_cache.get(session_id)
+        if entry is not None and entry[1] is not None:
+            _session_cache.move_to_end(session_id)
+            return list(entry[1])
+        
+        # 조회 중에 쓰기가 있었는지 알 수 있도록 자리표시 항목을 남김
+        token = object()
+        _session_cache[session_id] = (token, None)
+        _session_cache.move_to_end(session_id)
+        while len(_session_cache) > _SESSION_CACHE_MAX_ENTRIES:
+            _session_cache.popitem(last=False)
+    
+    messages = _query_session_messages(session_id)
+    
+    # 조회 중에 쓰기나 다른 조회가 자리표시를 바꾸지 않았을 때만 캐시에 저장
+    with _cache_lock:
+        entry = _session_cache.get(session_id)
+        if entry is not None and entry[0] is token:
+            _session_cache[session_id] = (token, messages)
+    
+    return list(messages)
+
+
+def _query_session_messages(session_id: str) -> List[dict]:
+    """세션의 모든 메시지를 DB에서 조회합니다."""
     with get_connection() as conn:
         cursor = conn.cursor()
+        # 행마다 sqlite3.Row를 만들지 않도록 튜플로 받아 위치로 언패킹
+        cursor.row_factory = None
         cursor.execute("""
             SELECT message_id, role, content, sources, timestamp
             FROM messages
@@ -139,36 +402,70 @@ def get_session_messages(session_id: str) -> List[dict]:
         """, (session_id,))
         
         messages = []
-        for row in cursor.fetchall():
+        for message_id, role, content, sources, timestamp in cursor.fetchall():
             msg = {
-                "message_id": row["message_id"],
-                "role": row["role"],
-                "content": row["content"],
-                "timestamp": row["timestamp"],
+                "message_id": message_id,
+                "role": role,
+                "content": content,
+                "timestamp": timestamp,
             }
-            if row["sources"]:
-                msg["sources"] = json.loads(row["sources"])
+            if sources:
+                msg["sources"] = orjson.loads(sources)
             messages.append(msg)
         
         return messages
 
 
-def get_session_history(session_id: str) -> List[dict]:
-    """세션의 대화 히스토리를 반환합니다 (role, content만)."""
-    messages = get_session_messages(session_id)
-    return [{"role": m["role"], "content": m["content"]} for m in messages]
+def get_session_history(session_id: str, limit: Optional[int] = None) -> List[dict]:
+    """
+    세션의 대화 히스토리를 반환합니다 (role, content만).
+    
+    Args:
+        session_id: 세션 ID
+        limit: 반환할 최근 메시지 수 (None 또는 0이면 전체)
+    """
+    # 최신 조회 결과가 캐시에 있으면 그대로 사용
+    with _cache_lock:
+        entry = _session_cache.get(session_id)
+        if entry is not None and entry[1] is not None:
+            _session_cache.move_to_end(session_id)
+            messages = entry[1][-limit:] if limit else entry[1]
+            return [{"role": m["role"], "content": m["content"]} for m in messages]
+    
+    # 캐시에 없으면 필요한 컬럼만 조회 (sources JSON을 읽거나 파싱하지 않음)
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        if limit:
+            rows = cursor.execute("""
+                SELECT role, content FROM (
+                    SELECT id, role, content
+                    FROM messages
+                    WHERE session_id = ?
+                    ORDER BY id DESC
+                    LIMIT ?
+                ) ORDER BY id ASC
+            """, (session_id, limit)).fetchall()
+        else:
+            rows = cursor.execute("""
+                SELECT role, content
+                FROM messages
+                WHERE session_id = ?
+                ORDER BY id ASC
+            """, (session_id,)).fetchall()
+    
+    return [{"role": role, "content": content} for role, content in rows]
 
 
 def delete_session(session_id: str) -> bool:
-    """세션과 관련 메시지를 삭제합니다."""
+    """세션과 관련 메시지를 삭제합니다 (메시지는 ON DELETE CASCADE로 함께 삭제)."""
     with get_connection() as conn:
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
-        cursor.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
-        
+        deleted = conn.execute(
+            "DELETE FROM sessions WHERE session_id = ? RETURNING 1", (session_id,)
+        ).fetchone() is not None
         conn.commit()
-        deleted = cursor.rowcount > 0
+        
+        _invalidate_session_cache(session_id)
         
         if deleted:
             logger.info(f"세션 삭제: {session_id}")
@@ -180,20 +477,23 @@ def get_all_sessions() -> List[dict]:
     """모든 세션 목록을 조회합니다."""
     with get_connection() as conn:
         cursor = conn.cursor()
+        # 메시지 테이블을 한 번만 집계하여 세션별 메시지 수와 첫 사용자 메시지 id를 구한 뒤
+        # 세션마다 상관 서브쿼리를 실행하지 않고 rowid로 첫 메시지 내용을 조회
         cursor.execute("""
             SELECT s.session_id, s.created_at, s.updated_at,
-                   COUNT(m.id) as message_count,
-                   (SELECT content FROM messages 
-                    WHERE session_id = s.session_id AND role = 'user' 
-                    ORDER BY id ASC LIMIT 1) as first_message
+                   COALESCE(c.message_count, 0) as message_count,
+                   m.content as first_message
             FROM sessions s
-            LEFT JOIN messages m ON s.session_id = m.session_id
-            GROUP BY s.session_id
+            LEFT JOIN (
+                SELECT session_id,
+                       COUNT(*) as message_count,
+                       MIN(CASE WHEN role = 'user' THEN id END) as first_user_id
+                FROM messages
+                GROUP BY session_id
+            ) c ON c.session_id = s.session_id
+            LEFT JOIN messages m ON m.id = c.first_user_id
             ORDER BY s.updated_at DESC
         """)
         
         return [dict(row) for row in cursor.fetchall()]
 
-
-# 앱 시작 시 DB 초기화
-init_db()
@@ -6,23 +6,31 @@ CORS 설정, 라우터 등록, Socket.IO 통합, 로깅 설정 등을 담당합
 """
 
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 import socketio
 
 from .config import get_settings
 from .utils.logger import setup_logging, get_logger
+from .utils.timestamp import utc_now_iso
 from .utils.exceptions import (
     RAGChatbotException,
     get_user_friendly_message,
 )
-from .api.websocket import sio, get_socket_app
+from .api.websocket import (
+    sio,
+    get_socket_app,
+    drain_background_tasks,
+    start_session_reaper,
+    stop_session_reaper,
+)
 from .api.chat import router as chat_router
+from .bedrock_client import close_bedrock_client
+from .db import init_db, close_all_connections
 
 
 # 로깅 설정
@@ -59,9 +67,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         f"서버 설정: host={settings.backend_host}, port={settings.backend_port}"
     )
     
+    # 설정 로드 후 프로세스마다 한 번만 DB 스키마 초기화 (import 시 I/O 없음)
+    init_db()
+    start_session_reaper()
+    
     yield
     
     # 종료 시 실행
+    await stop_session_reaper()
+    await drain_background_tasks()
+    await close_bedrock_client()
+    close_all_connections()
     logger.info("RAG 챗봇 시스템 종료")
 
 
@@ -71,6 +87,7 @@ app = FastAPI(
     description="사내 문서 기반 RAG(Retrieval-Augmented Generation) AI 챗봇 API",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -91,8 +108,10 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],  # 모든 HTTP 메서드 허용
-    allow_headers=["*"],  # 모든 헤더 허용
+    # 실제 사용하는 메서드/헤더만 허용하고 Preflight 응답을 하루 동안 캐시
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
 logger.info(f"CORS 설정 완료: allowed_origins={allowed_origins}")
@@ -116,7 +135,7 @@ async def health_check() -> HealthResponse:
     """
     return HealthResponse(
         status="ok",
-        timestamp=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        timestamp=utc_now_iso()
     )
 
 
@@ -172,7 +191,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     logger.error(f"처리되지 않은 예외: {type(exc).__name__} - {str(exc)}")
     
     user_message = get_user_friendly_message(exc)
-    timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    timestamp = utc_now_iso()
     
     return JSONResponse(
         status_code=500,
@@ -7,9 +7,10 @@ MCP는 선택적 기능으로, 외부 도구 및 데이터 소스와의 통합
 현재는 기본 구조만 제공하며, 향후 확장을 위한 인터페이스를 정의합니다.
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -28,7 +29,7 @@ class MCPServerStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPTool:
     """
     MCP 도구 정의
@@ -51,7 +52,7 @@ class MCPTool:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPToolResult:
     """
     MCP 도구 실행 결과
@@ -202,14 +203,21 @@ class MCPManager:
             logger.warning("MCP가 비활성화되어 있습니다.")
             return {}
         
+        # 서버별 연결은 서로 독립적이므로 동시에 수행합니다.
+        names = list(self._servers)
+        outcomes = await asyncio.gather(
+            *(self._servers[name].connect() for name in names),
+            return_exceptions=True,
+        )
+        
         results = {}
-        for name, server in self._servers.items():
-            try:
-                results[name] = await server.connect()
-                logger.info(f"MCP 서버 연결 성공: {name}")
-            except Exception as e:
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
                 results[name] = False
-                logger.error(f"MCP 서버 연결 실패: {name} - {e}")
+                logger.error(f"MCP 서버 연결 실패: {name} - {outcome}")
+            else:
+                results[name] = outcome
+                logger.info(f"MCP 서버 연결 성공: {name}")
         
         return results
     
@@ -220,14 +228,20 @@ class MCPManager:
         Returns:
             Dict[str, bool]: 서버별 연결 해제 결과
         """
+        names = list(self._servers)
+        outcomes = await asyncio.gather(
+            *(self._servers[name].disconnect() for name in names),
+            return_exceptions=True,
+        )
+        
         results = {}
-        for name, server in self._servers.items():
-            try:
-                results[name] = await server.disconnect()
-                logger.info(f"MCP 서버 연결 해제: {name}")
-            except Exception as e:
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
                 results[name] = False
-                logger.error(f"MCP 서버 연결 해제 실패: {name} - {e}")
+                logger.error(f"MCP 서버 연결 해제 실패: {name} - {outcome}")
+            else:
+                results[name] = outcome
+                logger.info(f"MCP 서버 연결 해제: {name}")
         
         return results
     
@@ -241,14 +255,23 @@ class MCPManager:
         if not self._enabled:
             return {}
         
+        connected = [
+            name
+            for name, server in self._servers.items()
+            if server.status == MCPServerStatus.CONNECTED
+        ]
+        outcomes = await asyncio.gather(
+            *(self._servers[name].list_tools() for name in connected),
+            return_exceptions=True,
+        )
+        
         tools = {}
-        for name, server in self._servers.items():
-            if server.status == MCPServerStatus.CONNECTED:
-                try:
-                    tools[name] = await server.list_tools()
-                except Exception as e:
-                    logger.error(f"도구 목록 조회 실패: {name} - {e}")
-                    tools[name] = []
+        for name, outcome in zip(connected, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"도구 목록 조회 실패: {name} - {outcome}")
+                tools[name] = []
+            else:
+                tools[name] = outcome
         
         return tools
     
@@ -302,6 +325,57 @@ class MCPManager:
             )
 
 
+# JSON Schema 타입 이름 → Python 타입
+_JSON_SCHEMA_TYPES: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+}
+
+
+def _compile_input_validator(
+    input_schema: Dict[str, Any],
+) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """
+    도구 입력 스키마를 인자 검증 함수로 미리 변환
+    
+    도구 등록 시 한 번만 스키마를 해석하고, 호출 시에는 필수 키와
+    최상위 속성 타입만 확인합니다. (required / properties.type 지원)
+    
+    Args:
+        input_schema: 도구 입력 스키마 (JSON Schema)
+    
+    Returns:
+        Callable: 인자를 받아 에러 메시지(유효하면 None)를 반환하는 함수
+    """
+    required = tuple(input_schema.get("required", ()))
+    typed = tuple(
+        (key, _JSON_SCHEMA_TYPES[spec["type"]], spec["type"])
+        for key, spec in input_schema.get("properties", {}).items()
+        if spec.get("type") in _JSON_SCHEMA_TYPES
+    )
+    
+    def validate(arguments: Dict[str, Any]) -> Optional[str]:
+        for key in required:
+            if key not in arguments:
+                return f"필수 인자가 없습니다: {key}"
+        for key, expected, type_name in typed:
+            value = arguments.get(key)
+            if value is None:
+                continue
+            # bool은 int의 하위 타입이므로 숫자 타입에서 제외
+            if not isinstance(value, expected) or (
+                isinstance(value, bool) and type_name != "boolean"
+            ):
+                return f"인자 타입이 올바르지 않습니다: {key} ({type_name} 필요)"
+        return None
+    
+    return validate
+
+
 # 전역 MCP 관리자 인스턴스
 _mcp_manager: Optional[MCPManager] = None
 
@@ -348,6 +422,7 @@ class AWSDocsMCPServer(MCPServerBase):
         self._server_url = server_url or get_settings().mcp_server_url
         self._status = MCPServerStatus.DISCONNECTED
         self._tools: List[MCPTool] = []
+        self._validators: Dict[str, Callable[[Dict[str, Any]], Optional[str]]] = {}
     
     @property
     def status(self) -> MCPServerStatus:
@@ -402,6 +477,10 @@ class AWSDocsMCPServer(MCPServerBase):
                     }
                 ),
             ]
+            self._validators = {
+                tool.name: _compile_input_validator(tool.input_schema)
+                for tool in self._tools
+            }
             
             logger.info("AWS Docs MCP 서버 연결 성공")
             return True
@@ -415,6 +494,7 @@ class AWSDocsMCPServer(MCPServerBase):
         """서버 연결 해제"""
         self._status = MCPServerStatus.DISCONNECTED
         self._tools = []
+        self._validators = {}
         logger.info("AWS Docs MCP 서버 연결 해제")
         return True
     
@@ -431,6 +511,16 @@ class AWSDocsMCPServer(MCPServerBase):
                 error="서버가 연결되어 있지 않습니다.",
             )
         
+        validator = self._validators.get(tool_name)
+        if validator is not None:
+            error = validator(arguments)
+            if error is not None:
+                return MCPToolResult(
+                    tool_name=tool_name,
+                    success=False,
+                    error=error,
+                )
+        
         # TODO: 실제 도구 실행 로직 구현
         # 현재는 플레이스홀더
         
@@ -10,7 +10,13 @@ from .knowledge_base import (
     RetrievedChunk,
     KnowledgeBaseResponse,
     create_knowledge_base_client,
+    get_document_name,
+    get_kb_client,
+    invalidate_agent_runtime_client,
+    iter_words,
+    reset_kb_client,
 )
+from .cache import ResponseCache
 
 
 __all__ = [
@@ -19,4 +25,11 @@ __all__ = [
     "RetrievedChunk",
     "KnowledgeBaseResponse",
     "create_knowledge_base_client",
+    "get_document_name",
+    "get_kb_client",
+    "invalidate_agent_runtime_client",
+    "iter_words",
+    "reset_kb_client",
+    # cache
+    "ResponseCache",
 ]
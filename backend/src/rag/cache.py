@@ -0,0 +1,113 @@
+"""
+Knowledge Base 응답 캐시 모듈
+
+동일한 질문에 대해 Knowledge Base RetrieveAndGenerate 호출을 반복하지 않도록
+생성된 응답을 메모리에 캐시합니다. TTL 만료와 LRU 방식의 크기 제한을 지원합니다.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Generic, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class ResponseCache(Generic[T]):
+    """
+    TTL + LRU 응답 캐시
+    
+    정규화한 질문으로 만든 키에 응답을 저장합니다.
+    스레드 안전성을 위해 Lock을 사용합니다.
+    """
+    
+    def __init__(self, max_entries: int = 512, ttl_seconds: int = 300):
+        """
+        ResponseCache 초기화
+        
+        Args:
+            max_entries: 최대 캐시 항목 수 (0이면 캐시 비활성화)
+            ttl_seconds: 캐시 만료 시간 (초, 0이면 캐시 비활성화)
+        """
+        self._entries: "OrderedDict[str, Tuple[float, T]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._lock = Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        """캐시 활성화 여부"""
+        return self._max_entries > 0 and self._ttl_seconds > 0
+    
+    @staticmethod
+    def make_key(query: str) -> str:
+        """
+        캐시 키를 생성합니다.
+        
+        공백과 대소문자를 정규화한 질문을 해시합니다.
+        
+        Args:
+            query: 사용자 질문
+        
+        Returns:
+            str: 캐시 키
+        """
+        payload = " ".join(query.split()).lower().encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[T]:
+        """
+        캐시된 응답을 조회합니다.
+        
+        Args:
+            key: 캐시 키
+        
+        Returns:
+            Optional[T]: 캐시된 응답 (없거나 만료되었으면 None)
+        """
+        if not self.enabled:
+            return None
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            
+            # LRU 업데이트
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: T) -> None:
+        """
+        응답을 캐시에 저장합니다.
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 응답
+        """
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            
+            # 최대 항목 수 초과 시 오래된 항목 제거
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """모든 캐시 항목을 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -5,21 +5,28 @@ AWS Bedrock Knowledge Base 클라이언트 모듈
 문서 검색과 응답 생성을 Knowledge Base API를 통해 처리합니다.
 """
 
-import json
-from typing import List, Optional, AsyncGenerator
+import asyncio
+import re
+import threading
+from functools import lru_cache
+from typing import List, Optional, AsyncGenerator, Iterator, Tuple
 from dataclasses import dataclass, field
 
-import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, HTTPClientError
 
 from ..config import get_settings, get_aws_config
 from ..utils.logger import get_logger
+from .cache import ResponseCache
 
 
 logger = get_logger(__name__)
 
 
-@dataclass
+# 스트리밍 시뮬레이션용 단어 패턴 (단어와 뒤따르는 원본 공백을 함께 매칭)
+_WORD_PATTERN = re.compile(r"\S+\s*")
+
+
+@dataclass(slots=True)
 class RetrievedChunk:
     """
     검색된 문서 청크
@@ -36,7 +43,7 @@ class RetrievedChunk:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeBaseResponse:
     """
     Knowledge Base 응답
@@ -51,6 +58,82 @@ class KnowledgeBaseResponse:
     retrieved_chunks: List[RetrievedChunk] = field(default_factory=list)
 
 
+@lru_cache(maxsize=4096)
+def get_document_name(source_uri: str) -> str:
+    """
+    원본 문서 URI에서 문서명(파일명)을 추출합니다.
+    
+    같은 문서가 여러 응답에 반복해서 등장하므로 결과를 캐시합니다.
+    
+    Args:
+        source_uri: 원본 문서 S3 URI
+    
+    Returns:
+        str: 문서명 (URI가 비어 있으면 'unknown')
+    """
+    return source_uri.rsplit('/', 1)[-1] if source_uri else 'unknown'
+
+
+def iter_words(text: str) -> Iterator[str]:
+    """
+    스트리밍 시뮬레이션용으로 텍스트를 단어 단위로 나눕니다.
+    
+    각 단어는 뒤따르는 원본 공백/줄바꿈을 포함하므로 이어 붙이면 원문과 같습니다.
+    
+    Args:
+        text: 나눌 텍스트
+    
+    Yields:
+        str: 단어와 뒤따르는 공백
+    """
+    for match in _WORD_PATTERN.finditer(text):
+        yield match.group()
+
+
+@lru_cache(maxsize=8)
+def _get_agent_runtime_client(
+    aws_config_items: Tuple[Tuple[str, str], ...],
+    max_pool_connections: int,
+):
+    """
+    Bedrock Agent Runtime boto3 클라이언트를 생성하고 캐시합니다.
+    
+    클라이언트 생성은 서비스 모델 로딩과 엔드포인트 해석 비용이 크므로
+    같은 AWS 설정에 대해서는 인스턴스와 커넥션 풀을 프로세스 전체에서 공유합니다.
+    boto3 클라이언트는 스레드 안전합니다.
+    
+    Args:
+        aws_config_items: get_aws_config() 결과를 정렬한 (키, 값) 튜플 (캐시 키)
+        max_pool_connections: 커넥션 풀 크기
+    
+    Returns:
+        botocore.client.BaseClient: bedrock-agent-runtime 클라이언트
+    """
+    # boto3는 Knowledge Base를 처음 사용할 때 import
+    import boto3
+    from botocore.config import Config as BotoConfig
+    
+    # adaptive 재시도 모드는 Throttling 응답에 맞춰 클라이언트 측 전송 속도를 조절
+    return boto3.client(
+        'bedrock-agent-runtime',
+        config=BotoConfig(
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=True,
+            retries={'max_attempts': 3, 'mode': 'adaptive'},
+        ),
+        **dict(aws_config_items)
+    )
+
+
+def invalidate_agent_runtime_client() -> None:
+    """
+    캐시된 bedrock-agent-runtime 클라이언트를 모두 폐기합니다.
+    
+    다음 _get_agent_runtime_client() 호출 시 새 클라이언트와 커넥션 풀이 생성됩니다.
+    """
+    _get_agent_runtime_client.cache_clear()
+
+
 class BedrockKnowledgeBase:
     """
     AWS Bedrock Knowledge Base 클라이언트
@@ -79,10 +162,17 @@ class BedrockKnowledgeBase:
         if not self.knowledge_base_id:
             raise ValueError("Knowledge Base ID가 설정되지 않았습니다.")
         
-        # Bedrock Agent Runtime 클라이언트 (Knowledge Base API용)
-        self._client = boto3.client(
-            'bedrock-agent-runtime',
-            **aws_config
+        # Bedrock Agent Runtime 클라이언트 (Knowledge Base API용, 프로세스 전역 공유)
+        self._client_key = (
+            tuple(sorted(aws_config.items())),
+            settings.aws_max_pool_connections,
+        )
+        self._client = _get_agent_runtime_client(*self._client_key)
+        
+        # 동일 질문 반복 시 RetrieveAndGenerate 호출을 생략하기 위한 응답 캐시
+        self._response_cache: ResponseCache[KnowledgeBaseResponse] = ResponseCache(
+            max_entries=settings.kb_cache_max_entries,
+            ttl_seconds=settings.kb_cache_ttl_seconds,
         )
         
         logger.info(
@@ -90,6 +180,17 @@ class BedrockKnowledgeBase:
             f"kb_id={self.knowledge_base_id}"
         )
     
+    def _reset_client(self) -> None:
+        """
+        끊어진 커넥션이 남은 공유 클라이언트를 버리고 새로 생성합니다.
+        
+        boto3 재시도로도 복구되지 않은 커넥션 오류 후 호출하여,
+        다음 요청부터는 새 커넥션 풀을 사용하도록 합니다.
+        """
+        invalidate_agent_runtime_client()
+        self._client = _get_agent_runtime_client(*self._client_key)
+        logger.warning("Knowledge Base 클라이언트 재생성 (커넥션 오류)")
+    
     def retrieve(
         self,
         query: str,
@@ -143,6 +244,11 @@ class BedrockKnowledgeBase:
         except ClientError as e:
             logger.error(f"Knowledge Base 검색 실패: {e}")
             raise
+            
+        except HTTPClientError as e:
+            logger.error(f"Knowledge Base 연결 오류: {e}")
+            self._reset_client()
+            raise
     
     def retrieve_and_generate(
         self,
@@ -159,6 +265,13 @@ class BedrockKnowledgeBase:
         Returns:
             KnowledgeBaseResponse: 생성된 응답
         """
+        # 대화 히스토리는 Knowledge Base 요청에 포함되지 않으므로 질문만으로 캐시
+        cache_key = ResponseCache.make_key(query)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"응답 캐시 적중: query='{query[:50]}...'")
+            return cached
+        
         try:
             # 요청 구성
             request_params = {
@@ -193,6 +306,9 @@ class BedrockKnowledgeBase:
             # 인용 정보 추출
             citations = []
             retrieved_chunks = []
+            # 여러 인용이 같은 참조 청크를 가리키는 경우가 많으므로 한 번만 수집
+            # (순위가 높은 첫 번째 등장을 유지)
+            seen_chunks = set()
             
             for citation in response.get('citations', []):
                 citation_info = {
@@ -204,16 +320,22 @@ class BedrockKnowledgeBase:
                     content = ref.get('content', {}).get('text', '')
                     location = ref.get('location', {})
                     s3_location = location.get('s3Location', {})
+                    source_uri = s3_location.get('uri', '')
                     
                     citation_info['references'].append({
                         'content': content[:200] + '...' if len(content) > 200 else content,
-                        'source_uri': s3_location.get('uri', '')
+                        'source_uri': source_uri
                     })
                     
+                    chunk_key = (source_uri, content)
+                    if chunk_key in seen_chunks:
+                        continue
+                    seen_chunks.add(chunk_key)
+                    
                     retrieved_chunks.append(RetrievedChunk(
                         content=content,
                         score=1.0,  # RetrieveAndGenerate는 점수를 반환하지 않음
-                        source_uri=s3_location.get('uri', ''),
+                        source_uri=source_uri,
                         metadata={}
                     ))
                 
@@ -221,15 +343,22 @@ class BedrockKnowledgeBase:
             
             logger.info(f"응답 생성 완료: query='{query[:50]}...'")
             
-            return KnowledgeBaseResponse(
+            result = KnowledgeBaseResponse(
                 answer=answer,
                 citations=citations,
                 retrieved_chunks=retrieved_chunks
             )
+            self._response_cache.set(cache_key, result)
+            return result
             
         except ClientError as e:
             logger.error(f"RetrieveAndGenerate 실패: {e}")
             raise
+            
+        except HTTPClientError as e:
+            logger.error(f"Knowledge Base 연결 오류: {e}")
+            self._reset_client()
+            raise
     
     async def retrieve_and_generate_stream(
         self,
@@ -250,15 +379,14 @@ class BedrockKnowledgeBase:
             tuple[str, Optional[KnowledgeBaseResponse]]: (토큰, 완료 시 전체 응답)
         """
         try:
-            # 전체 응답 생성
-            response = self.retrieve_and_generate(query, conversation_history)
-            
-            # 응답을 단어 단위로 스트리밍 시뮬레이션
-            words = response.answer.split()
+            # 전체 응답 생성 (동기 boto3 호출이므로 스레드에서 실행)
+            response = await asyncio.to_thread(
+                self.retrieve_and_generate, query, conversation_history
+            )
             
-            for i, word in enumerate(words):
-                is_last = (i == len(words) - 1)
-                yield word + (" " if not is_last else ""), None
+            # 응답을 단어 단위로 스트리밍 시뮬레이션 (원본 공백/줄바꿈 유지)
+            for word in iter_words(response.answer):
+                yield word, None
             
             # 마지막에 전체 응답 반환
             yield "", response
@@ -277,3 +405,42 @@ def create_knowledge_base_client() -> BedrockKnowledgeBase:
         BedrockKnowledgeBase: Knowledge Base 클라이언트
     """
     return BedrockKnowledgeBase()
+
+
+# 전역 Knowledge Base 클라이언트 인스턴스 (지연 초기화)
+_kb_client: Optional[BedrockKnowledgeBase] = None
+_kb_client_lock = threading.Lock()
+
+
+def get_kb_client() -> Optional[BedrockKnowledgeBase]:
+    """
+    Knowledge Base 클라이언트 싱글톤 인스턴스 반환
+    
+    REST API와 Socket.IO 핸들러가 같은 인스턴스(와 커넥션 풀, 응답 캐시)를
+    공유합니다. 동시 첫 요청에서 클라이언트가 중복 생성되지 않도록 Lock으로
+    초기화를 보호합니다.
+    
+    Returns:
+        Optional[BedrockKnowledgeBase]: Knowledge Base 클라이언트
+            (초기화 실패 시 None)
+    """
+    global _kb_client
+    if _kb_client is None:
+        with _kb_client_lock:
+            if _kb_client is None:
+                try:
+                    _kb_client = create_knowledge_base_client()
+                except Exception as e:
+                    logger.warning(f"Knowledge Base 초기화 실패 (에코 모드로 동작): {e}")
+    return _kb_client
+
+
+def reset_kb_client() -> None:
+    """
+    Knowledge Base 클라이언트 인스턴스 초기화
+    
+    테스트나 설정 변경 시 사용합니다.
+    """
+    global _kb_client
+    with _kb_client_lock:
+        _kb_client = None
@@ -5,6 +5,7 @@
 모듈 구성:
 - logger.py: 로깅 유틸리티
 - exceptions.py: 커스텀 예외 클래스
+- timestamp.py: 타임스탬프 유틸리티
 """
 
 from .logger import (
@@ -28,6 +29,8 @@ from .exceptions import (
     is_retryable_error,
 )
 
+from .timestamp import utc_now_iso, format_utc_ns
+
 __all__ = [
     # Logger
     "setup_logging",
@@ -46,4 +49,7 @@ __all__ = [
     "ConfigurationError",
     "get_user_friendly_message",
     "is_retryable_error",
+    # Timestamp
+    "utc_now_iso",
+    "format_utc_ns",
 ]
@@ -6,7 +6,8 @@
 """
 
 from typing import Optional, Dict, Any
-from datetime import datetime, timezone
+
+from .timestamp import utc_now_iso
 
 
 class RAGChatbotException(Exception):
@@ -33,7 +34,7 @@ class RAGChatbotException(Exception):
         self.message = message
         self.details = details or {}
         self.retryable = retryable
-        self.timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        self.timestamp = utc_now_iso()
         super().__init__(message)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -7,13 +7,14 @@ JSON 형식의 구조화된 로깅을 제공합니다.
 """
 
 import logging
-import json
 import re
 import sys
-from datetime import datetime, timezone
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Dict, List, Pattern, Tuple
+
+import orjson
 
 from ..config import get_settings
+from .timestamp import format_utc_ns
 
 
 # 마스킹할 민감 정보 패턴
@@ -32,6 +33,18 @@ SENSITIVE_PATTERNS: List[tuple] = [
     (r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', r'***@\2'),
 ]
 
+# 로그 레코드마다 패턴을 다시 해석하지 않도록 import 시점에 한 번만 컴파일
+_COMPILED_SENSITIVE_PATTERNS: Tuple[Tuple[Pattern[str], str], ...] = tuple(
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in SENSITIVE_PATTERNS
+)
+
+# 위 패턴이 매칭되려면 반드시 포함해야 하는 문자열 (하나도 없으면 마스킹 생략)
+# SENSITIVE_PATTERNS에 패턴을 추가하면 여기에도 해당 키워드를 추가해야 합니다.
+_SENSITIVE_HINT: Pattern[str] = re.compile(
+    r'aws_|akia|password|secret|api|token|@', re.IGNORECASE
+)
+
 
 def mask_sensitive_data(text: str) -> str:
     """
@@ -46,9 +59,13 @@ def mask_sensitive_data(text: str) -> str:
     if not isinstance(text, str):
         return text
     
+    # 대부분의 로그에는 민감 정보가 없으므로 한 번의 검색으로 걸러냄
+    if _SENSITIVE_HINT.search(text) is None:
+        return text
+    
     result = text
-    for pattern, replacement in SENSITIVE_PATTERNS:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    for pattern, replacement in _COMPILED_SENSITIVE_PATTERNS:
+        result = pattern.sub(replacement, result)
     
     return result
 
@@ -59,6 +76,7 @@ class JSONFormatter(logging.Formatter):
     
     로그 메시지를 JSON 형식으로 변환하여 구조화된 로깅을 제공합니다.
     민감 정보는 자동으로 마스킹됩니다.
+    타임스탬프는 레코드 생성 시각(record.created)을 사용하며 orjson으로 직렬화합니다.
     """
     
     def format(self, record: logging.LogRecord) -> str:
@@ -75,7 +93,7 @@ class JSONFormatter(logging.Formatter):
         message = mask_sensitive_data(record.getMessage())
         
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": format_utc_ns(int(record.created * 1_000_000_000)),
             "level": record.levelname,
             "logger": record.name,
             "message": message,
@@ -100,7 +118,7 @@ class JSONFormatter(logging.Formatter):
                 self.formatException(record.exc_info)
             )
         
-        return json.dumps(log_data, ensure_ascii=False, default=str)
+        return orjson.dumps(log_data, default=str).decode()
 
 
 class TextFormatter(logging.Formatter):
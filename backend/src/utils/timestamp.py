@@ -0,0 +1,56 @@
+"""
+타임스탬프 유틸리티 모듈
+
+API 응답, 이벤트, DB 레코드에서 공통으로 사용하는 UTC ISO 8601 타임스탬프를 생성합니다.
+"""
+
+import time
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _format_utc_seconds(seconds: int) -> str:
+    """
+    초 단위 UTC 시각을 ISO 8601 날짜/시간 문자열로 변환합니다.
+    
+    같은 초 안에서 반복 호출되면 캐시된 문자열을 반환합니다.
+    
+    Args:
+        seconds: Unix epoch 초
+    
+    Returns:
+        str: "YYYY-MM-DDTHH:MM:SS" 형식 문자열
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def utc_now_iso() -> str:
+    """
+    현재 UTC 시각을 ISO 8601 형식으로 반환합니다.
+    
+    `datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")`와 같은 형식이며,
+    마이크로초 자리를 항상 포함합니다.
+    
+    Returns:
+        str: "YYYY-MM-DDTHH:MM:SS.ffffffZ" 형식 타임스탬프
+    """
+    now = time.time()
+    seconds = int(now)
+    return f"{_format_utc_seconds(seconds)}.{int((now - seconds) * 1_000_000):06d}Z"
+
+
+def format_utc_ns(timestamp_ns: int) -> str:
+    """
+    나노초 단위 Unix 시각을 ISO 8601 형식으로 변환합니다.
+    
+    `utc_now_iso()`와 같은 형식을 사용하므로, 생성 시점에는 `time.time_ns()`만
+    저장해 두고 직렬화할 때 변환할 수 있습니다.
+    
+    Args:
+        timestamp_ns: Unix epoch 나노초 (`time.time_ns()`)
+    
+    Returns:
+        str: "YYYY-MM-DDTHH:MM:SS.ffffffZ" 형식 타임스탬프
+    """
+    seconds, remainder = divmod(timestamp_ns, 1_000_000_000)
+    return f"{_format_utc_seconds(seconds)}.{remainder // 1000:06d}Z"
@@ -6,4 +6,6 @@ Backend 테스트 모듈입니다.
 - test_rag.py: RAG 파이프라인 테스트
 - test_api.py: API 엔드포인트 테스트
 - test_bedrock.py: Bedrock 클라이언트 테스트
+- test_stream_buffer.py: 스트리밍 청크 버퍼 테스트
+- test_database.py: DB 스키마 마이그레이션 테스트
 """
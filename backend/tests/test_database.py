@@ -0,0 +1,131 @@
+"""
+데이터베이스 스키마 마이그레이션 테스트
+
+기존(ON DELETE CASCADE 없는) 스키마의 DB에 init_db()를 실행했을 때
+데이터 보존, 외래 키, 인덱스, 트리거와 재실행 시 무변경을 확인합니다.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.db import database
+
+
+# 마이그레이션 이전 스키마 (세션 삭제 시 메시지가 남는 외래 키)
+_BASELINE_SCHEMA = """
+    CREATE TABLE sessions (
+        session_id TEXT PRIMARY KEY,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+    CREATE TABLE messages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        message_id TEXT UNIQUE NOT NULL,
+        session_id TEXT NOT NULL,
+        role TEXT NOT NULL,
+        content TEXT NOT NULL,
+        sources TEXT,
+        timestamp TEXT NOT NULL,
+        FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+    );
+    CREATE INDEX idx_messages_session ON messages(session_id);
+"""
+
+
+@pytest.fixture
+def baseline_db(tmp_path, monkeypatch):
+    """세션 행이 없는 메시지를 포함한 기존 스키마 DB를 만들고 경로를 연결합니다."""
+    db_path = tmp_path / "chat_history.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(_BASELINE_SCHEMA)
+    conn.execute(
+        "INSERT INTO sessions VALUES ('s1', '2024-01-01T00:00:00Z', '2024-01-01T00:00:01Z')"
+    )
+    conn.executemany(
+        "INSERT INTO messages (message_id, session_id, role, content, timestamp) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [
+            ("m1", "s1", "user", "질문", "2024-01-01T00:00:00Z"),
+            ("m2", "s1", "assistant", "답변", "2024-01-01T00:00:01Z"),
+            # 세션 행이 없는 메시지
+            ("m3", "orphan", "user", "고아 질문", "2024-01-02T00:00:00Z"),
+            ("m4", "orphan", "assistant", "고아 답변", "2024-01-02T00:00:05Z"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+    
+    monkeypatch.setattr(database, "get_db_path", lambda: db_path)
+    yield db_path
+    database.close_all_connections()
+    database._session_cache.clear()
+
+
+def _schema(conn: sqlite3.Connection) -> list:
+    return conn.execute(
+        "SELECT type, name, sql FROM sqlite_master ORDER BY type, name"
+    ).fetchall()
+
+
+def test_init_db_migrates_baseline_schema(baseline_db):
+    database.init_db()
+    
+    conn = sqlite3.connect(baseline_db)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 4
+        assert conn.execute(
+            "SELECT message_id FROM messages ORDER BY id"
+        ).fetchall() == [("m1",), ("m2",), ("m3",), ("m4",)]
+        
+        # 고아 메시지의 세션은 메시지 시각 범위로 생성
+        assert conn.execute(
+            "SELECT session_id, created_at, updated_at FROM sessions ORDER BY session_id"
+        ).fetchall() == [
+            ("orphan", "2024-01-02T00:00:00Z", "2024-01-02T00:00:05Z"),
+            ("s1", "2024-01-01T00:00:00Z", "2024-01-01T00:00:01Z"),
+        ]
+        
+        foreign_keys = conn.execute("PRAGMA foreign_key_list(messages)").fetchall()
+        assert [(fk[2], fk[3], fk[6]) for fk in foreign_keys] == [
+            ("sessions", "session_id", "CASCADE")
+        ]
+        
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(messages)")}
+        assert {"idx_messages_session", "idx_messages_session_role"} <= indexes
+        
+        triggers = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+        ).fetchall()
+        assert triggers == [("trg_messages_touch_session",)]
+        
+        assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+    finally:
+        conn.close()
+    
+    # 마이그레이션 후에는 세션 삭제 시 메시지도 함께 삭제
+    assert database.delete_session("orphan") is True
+    assert database.get_session_messages("orphan") == []
+    assert [m["message_id"] for m in database.get_session_messages("s1")] == ["m1", "m2"]
+
+
+def test_init_db_is_idempotent(baseline_db):
+    database.init_db()
+    
+    conn = sqlite3.connect(baseline_db)
+    try:
+        schema = _schema(conn)
+        rows = conn.execute("SELECT * FROM messages ORDER BY id").fetchall()
+        sessions = conn.execute("SELECT * FROM sessions ORDER BY session_id").fetchall()
+    finally:
+        conn.close()
+    
+    database.init_db()
+    
+    conn = sqlite3.connect(baseline_db)
+    try:
+        assert _schema(conn) == schema
+        assert conn.execute("SELECT * FROM messages ORDER BY id").fetchall() == rows
+        assert conn.execute("SELECT * FROM sessions ORDER BY session_id").fetchall() == sessions
+    finally:
+        conn.close()
@@ -0,0 +1,84 @@
+"""
+StreamChunkBuffer 테스트
+
+청크 묶음 전송, 전송 주기 만료 시 flush, 종료 청크 전송을 확인합니다.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api import websocket
+from src.api.websocket import StreamChunkBuffer
+
+
+@pytest.fixture
+def emitted(monkeypatch):
+    """sio.emit 대신 전송된 청크를 기록합니다."""
+    chunks = []
+    
+    async def fake_emit(event, data, to=None):
+        chunks.append((event, data["content"], data["is_final"], to))
+    
+    monkeypatch.setattr(websocket.sio, "emit", fake_emit)
+    return chunks
+
+
+def test_coalesces_until_size_threshold(emitted):
+    async def scenario():
+        buffer = StreamChunkBuffer("sid", "s1", flush_interval=10, flush_chars=10)
+        await buffer.add("abc")
+        await buffer.add("def")
+        assert emitted == []
+        
+        await buffer.add("ghij")
+        assert emitted == [("chat_response_chunk", "abcdefghij", False, "sid")]
+        
+        await buffer.close()
+    
+    asyncio.run(scenario())
+    
+    # 크기 기준으로 모두 전송된 뒤에도 종료 청크는 전송
+    assert emitted[-1] == ("chat_response_chunk", "", True, "sid")
+    assert len(emitted) == 2
+
+
+def test_flushes_after_interval_without_next_token(emitted):
+    async def scenario():
+        buffer = StreamChunkBuffer("sid", "s1", flush_interval=0.02, flush_chars=1000)
+        await buffer.add("첫 토큰 ")
+        await asyncio.sleep(0.1)
+        assert emitted == [("chat_response_chunk", "첫 토큰 ", False, "sid")]
+        
+        await buffer.add("끝")
+        await buffer.close()
+    
+    asyncio.run(scenario())
+    
+    assert emitted[-1] == ("chat_response_chunk", "끝", True, "sid")
+    assert len(emitted) == 2
+
+
+def test_close_cancels_pending_deadline(emitted):
+    async def scenario():
+        buffer = StreamChunkBuffer("sid", "s1", flush_interval=0.02, flush_chars=1000)
+        await buffer.add("a")
+        await buffer.add("b")
+        await buffer.close()
+        await asyncio.sleep(0.1)
+    
+    asyncio.run(scenario())
+    
+    assert emitted == [("chat_response_chunk", "ab", True, "sid")]
+
+
+def test_discard_drops_buffered_text(emitted):
+    async def scenario():
+        buffer = StreamChunkBuffer("sid", "s1", flush_interval=0.02, flush_chars=1000)
+        await buffer.add("버려질 텍스트")
+        buffer.discard()
+        await asyncio.sleep(0.1)
+    
+    asyncio.run(scenario())
+    
+    assert emitted == []